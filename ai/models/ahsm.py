@@ -186,16 +186,18 @@ class AHSMEnsemble:
         lr_pipeline.fit(X, y)
         models.append(("logistic_regression", lr_pipeline))
 
+        X_tree = np.ascontiguousarray(X, dtype=np.float32)
+
         # Random Forest
         rf = RandomForestClassifier(n_estimators=200, max_depth=10, random_state=7)
-        rf.fit(X, y)
+        rf.fit(X_tree, y)
         models.append(("random_forest", rf))
 
         # Gradient Boosting
         gb = GradientBoostingClassifier(
             n_estimators=200, max_depth=5, learning_rate=0.1, random_state=21
         )
-        gb.fit(X, y)
+        gb.fit(X_tree, y)
         models.append(("gradient_boosting", gb))
 
         return models
@@ -143,12 +143,14 @@ class BiodiversityEnsemble:
         lr_pipeline.fit(X, y)
         models.append(("logistic_regression", lr_pipeline))
 
+        X_tree = np.ascontiguousarray(X, dtype=np.float32)
+
         rf = RandomForestClassifier(n_estimators=200, max_depth=8, random_state=7)
-        rf.fit(X, y)
+        rf.fit(X_tree, y)
         models.append(("random_forest", rf))
 
         gb = GradientBoostingClassifier(max_depth=3, random_state=21)
-        gb.fit(X, y)
+        gb.fit(X_tree, y)
         models.append(("gradient_boosting", gb))
 
         return models
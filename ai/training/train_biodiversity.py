@@ -14,7 +14,7 @@ from sklearn.linear_model import LogisticRegression
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
 
-from ..models.biodiversity import BiodiversityConfig, BiodiversityEnsemble, CLASS_LABELS
+from ..models.biodiversity import BiodiversityEnsemble, CLASS_LABELS
 from .base import BaseTrainer, TrainingConfig
 
 logging.basicConfig(level=logging.INFO)
@@ -84,8 +84,7 @@ def train_biodiversity(
         trainer.log_params({"dataset_source": training_data_path, "dataset_size": len(X)})
     else:
         logger.info("Generating synthetic training data")
-        ensemble = BiodiversityEnsemble(BiodiversityConfig())
-        X, y = ensemble._generate_training_data(n=2000)
+        X, y = BiodiversityEnsemble._generate_training_data(n=2000)
         trainer.log_params({"dataset_source": "synthetic", "dataset_size": len(X)})
 
     # Split data
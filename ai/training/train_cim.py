@@ -95,8 +95,7 @@ def train_cim(
         trainer.log_params({"dataset_source": training_data_path, "dataset_size": len(X)})
     else:
         logger.info("Generating synthetic training data")
-        ensemble = CIMEnsemble()
-        X, y = ensemble._generate_training_data(n=2500)
+        X, y = CIMEnsemble._generate_training_data(n=2500)
         trainer.log_params({"dataset_source": "synthetic", "dataset_size": len(X)})
 
     # Split data
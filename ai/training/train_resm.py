@@ -90,8 +90,7 @@ def train_resm(
         trainer.log_params({"dataset_source": training_data_path, "dataset_size": len(X)})
     else:
         logger.info("Generating synthetic training data")
-        ensemble = RESMEnsemble()
-        X, y = ensemble._generate_training_data(n=2000)
+        X, y = RESMEnsemble._generate_training_data(n=2000)
         trainer.log_params({"dataset_source": "synthetic", "dataset_size": len(X)})
 
     # Split data
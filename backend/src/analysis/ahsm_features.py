@@ -4,7 +4,24 @@ from __future__ import annotations
 
 import geopandas as gpd
 
+from ..utils.geometry import compute_area_ha
 from .kpis import EnvironmentalKPIs
+from .land_cover_classes import (
+    AGRI_CLASSES,
+    FOREST_CLASSES,
+    IMPERVIOUS_CLASSES,
+    WATER_CLASSES,
+    category_areas,
+    summary_arrays,
+)
+
+# Land cover categories feeding the AHSM features
+_AHSM_CATEGORIES = {
+    "forest": FOREST_CLASSES,
+    "water": WATER_CLASSES,
+    "impervious": IMPERVIOUS_CLASSES,
+    "agricultural": AGRI_CLASSES,
+}
 
 
 def build_ahsm_features(
@@ -25,42 +42,26 @@ def build_ahsm_features(
     Returns:
         Dictionary of feature values for hazard susceptibility
     """
-    aoi_area_ha = aoi.geometry.area.sum() / 10_000
+    aoi_area_ha = compute_area_ha(aoi)
 
-    # Land cover features affecting hazard susceptibility
-    forest_classes = {"311", "312", "313"}
-    forest_area = sum(
-        float(row.get("total_area_ha", 0))
-        for row in land_cover_summary
-        if str(row.get("class_code")) in forest_classes
+    areas_by_category = category_areas(
+        *summary_arrays(land_cover_summary), _AHSM_CATEGORIES
     )
+
+    # Land cover features affecting hazard susceptibility
+    forest_area = areas_by_category["forest"]
     forest_ratio = forest_area / aoi_area_ha if aoi_area_ha > 0 else 0.0
 
     # Wetland/water features (affect flood risk)
-    water_classes = {"411", "412", "421", "511", "512"}
-    water_area = sum(
-        float(row.get("total_area_ha", 0))
-        for row in land_cover_summary
-        if str(row.get("class_code")) in water_classes
-    )
+    water_area = areas_by_category["water"]
     water_ratio = water_area / aoi_area_ha if aoi_area_ha > 0 else 0.0
 
     # Urban/impervious (affect flood runoff)
-    impervious_classes = {"111", "112", "121", "122", "131", "133"}
-    impervious_area = sum(
-        float(row.get("total_area_ha", 0))
-        for row in land_cover_summary
-        if str(row.get("class_code")) in impervious_classes
-    )
+    impervious_area = areas_by_category["impervious"]
     impervious_ratio = impervious_area / aoi_area_ha if aoi_area_ha > 0 else 0.0
 
     # Agricultural land (moderate risk)
-    agri_classes = {"211", "212", "213", "221", "222", "223", "231"}
-    agri_area = sum(
-        float(row.get("total_area_ha", 0))
-        for row in land_cover_summary
-        if str(row.get("class_code")) in agri_classes
-    )
+    agri_area = areas_by_category["agricultural"]
     agri_ratio = agri_area / aoi_area_ha if aoi_area_ha > 0 else 0.0
 
     # Distance to water bodies (flood risk indicator)
@@ -2,40 +2,70 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 import geopandas as gpd
+import numpy as np
+import pandas as pd
+import shapely
 
-FOREST_CLASSES = {"311", "312", "313"}
+from ..utils.geometry import compute_area_ha, geometries_area_ha
+from .land_cover_classes import FOREST_CLASSES, category_areas, summary_arrays
 
+# Shapely geometry type ids
+_POLYGONAL = (3, 6)  # Polygon, MultiPolygon
+_GEOMETRY_COLLECTION = 7
 
-def compute_overlap_metrics(
+
+def _empty_overlap_metrics() -> dict[str, float]:
+    return {
+        "protected_overlap_ha": 0.0,
+        "protected_overlap_pct": 0.0,
+        "protected_site_count": 0,
+        "fragmentation_index": 0.0,
+    }
+
+
+def _polygonal(geoms: np.ndarray) -> np.ndarray:
+    """Keep only polygonal parts of intersection results, like overlay's keep_geom_type."""
+    type_ids = shapely.get_type_id(geoms)
+    for idx in np.flatnonzero(type_ids == _GEOMETRY_COLLECTION):
+        parts = shapely.get_parts(geoms[idx])
+        geoms[idx] = shapely.union_all(parts[np.isin(shapely.get_type_id(parts), _POLYGONAL)])
+    return geoms
+
+
+def _overlap_geometries(
     aoi: gpd.GeoDataFrame, protected_areas: gpd.GeoDataFrame
-) -> tuple[dict[str, float], gpd.GeoDataFrame]:
-    """Return area/percentage overlap metrics and the overlapping GeoDataFrame."""
-    if protected_areas.empty:
-        return {
-            "protected_overlap_ha": 0.0,
-            "protected_overlap_pct": 0.0,
-            "protected_site_count": 0,
-            "fragmentation_index": 0.0,
-        }, protected_areas
-
-    overlap = gpd.overlay(protected_areas, aoi, how="intersection", keep_geom_type=True)
-    if overlap.empty:
-        return {
-            "protected_overlap_ha": 0.0,
-            "protected_overlap_pct": 0.0,
-            "protected_site_count": 0,
-            "fragmentation_index": 0.0,
-        }, overlap
-
-    overlap_area = overlap.geometry.area.sum()
-    aoi_area = aoi.geometry.area.sum()
-
-    overlap_ha = overlap_area / 10_000
-    aoi_ha = aoi_area / 10_000 if aoi_area > 0 else 1
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return positions of protected sites overlapping the AOI and their intersections.
+
+    The AOI is unioned and prepared once, candidate sites come from an STRtree
+    query, and only those hits are intersected with the AOI.
+    """
+    aoi_union = shapely.union_all(aoi.geometry.values)
+    shapely.prepare(aoi_union)
+    site_geoms = protected_areas.geometry.values
+    hits = shapely.STRtree(site_geoms).query(aoi_union, predicate="intersects")
+
+    intersections = _polygonal(shapely.intersection(site_geoms[hits], aoi_union))
+    keep = np.isin(shapely.get_type_id(intersections), _POLYGONAL) & ~shapely.is_empty(
+        intersections
+    )
+    return hits[keep], intersections[keep]
+
+
+def _overlap_metrics(aoi: gpd.GeoDataFrame, overlap: np.ndarray, crs: Any) -> dict[str, float]:
+    """Overlap metrics for the intersection geometries ``overlap`` (given in ``crs``)."""
+    if len(overlap) == 0:
+        return _empty_overlap_metrics()
+
+    overlap_ha = geometries_area_ha(overlap, crs)
+    aoi_ha = compute_area_ha(aoi) or 1
     overlap_pct = (overlap_ha / aoi_ha) * 100
 
-    site_count = overlap.shape[0]
+    site_count = len(overlap)
     fragmentation_index = min(1.0, site_count / max(1, len(aoi))) if site_count else 0.0
 
     return {
@@ -43,27 +73,62 @@ def compute_overlap_metrics(
         "protected_overlap_pct": overlap_pct,
         "protected_site_count": site_count,
         "fragmentation_index": fragmentation_index,
-    }, overlap
+    }
 
 
-def forest_ratio(land_cover_summary: list[dict]) -> float:
-    total_area = sum(float(row.get("total_area_ha", 0)) for row in land_cover_summary)
+def compute_overlap_metrics_scalar(
+    aoi: gpd.GeoDataFrame, protected_areas: gpd.GeoDataFrame
+) -> dict[str, float]:
+    """Return area/percentage overlap metrics without building the overlap GeoDataFrame."""
+    if protected_areas.empty:
+        return _empty_overlap_metrics()
+
+    if protected_areas.crs != aoi.crs:
+        protected_areas = protected_areas.to_crs(aoi.crs)
+
+    _, intersections = _overlap_geometries(aoi, protected_areas)
+    return _overlap_metrics(aoi, intersections, protected_areas.crs)
+
+
+def compute_overlap_metrics(
+    aoi: gpd.GeoDataFrame, protected_areas: gpd.GeoDataFrame
+) -> tuple[dict[str, float], gpd.GeoDataFrame]:
+    """Return area/percentage overlap metrics and the overlapping GeoDataFrame."""
+    if protected_areas.empty:
+        return _empty_overlap_metrics(), protected_areas
+
+    if protected_areas.crs != aoi.crs:
+        protected_areas = protected_areas.to_crs(aoi.crs)
+
+    hits, intersections = _overlap_geometries(aoi, protected_areas)
+    overlap = gpd.GeoDataFrame(
+        protected_areas.iloc[hits].drop(columns=protected_areas.geometry.name),
+        geometry=intersections,
+        crs=protected_areas.crs,
+    ).reset_index(drop=True)
+    return _overlap_metrics(aoi, intersections, protected_areas.crs), overlap
+
+
+def forest_ratio(land_cover_summary: list[dict] | pd.DataFrame) -> float:
+    """
+    Return the share of summarized land cover area that is forest.
+
+    Accepts either the list-of-records summary or a DataFrame with ``class_code``
+    and ``total_area_ha`` columns.
+    """
+    codes, areas = summary_arrays(land_cover_summary)
+    total_area = areas.sum()
     if total_area <= 0:
         return 0.0
-    forest_area = sum(
-        float(row.get("total_area_ha", 0))
-        for row in land_cover_summary
-        if str(row.get("class_code")) in FOREST_CLASSES
-    )
-    return forest_area / total_area
+    return category_areas(codes, areas, {"forest": FOREST_CLASSES})["forest"] / total_area
 
 
 def build_biodiversity_features(
     aoi: gpd.GeoDataFrame,
-    land_cover_summary: list[dict],
+    land_cover_summary: list[dict] | pd.DataFrame,
     overlap_metrics: dict[str, float],
 ) -> dict[str, float]:
-    aoi_area_ha = aoi.geometry.area.sum() / 10_000
+    aoi_area_ha = compute_area_ha(aoi)
     features = {
         "aoi_area_ha": aoi_area_ha,
         "protected_overlap_ha": overlap_metrics["protected_overlap_ha"],
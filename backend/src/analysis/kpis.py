@@ -10,19 +10,185 @@ This module implements scientifically-accurate environmental KPIs based on:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Any
 
-import geopandas as gpd
 import numpy as np
+import pandas as pd
+import shapely
 
 from ..logging_utils import get_logger
+from .land_cover_classes import (
+    FOREST_CLASSES,
+    IMPERVIOUS_CLASSES,
+    NATURAL_HABITAT_CLASSES,
+    NATURAL_VEGETATION_CLASSES,
+    category_areas,
+    summary_arrays,
+)
+
+# GeoPandas (and the helpers built on it) is imported inside the GeoDataFrame KPIs
+# so that summary-only callers do not pay for it at import time.
+if TYPE_CHECKING:
+    import geopandas as gpd
 
 
 logger = get_logger(__name__)
 
 
-@dataclass
+# Ecosystem service coefficients (relative values, normalized 0-1)
+# Based on TEEB and Costanza et al. (2014)
+SERVICE_COEFFICIENTS = pd.Series(
+    {
+        # High value natural habitats
+        "311": 0.95,  # Broad-leaved forest
+        "312": 0.95,  # Coniferous forest
+        "313": 0.95,  # Mixed forest
+        "321": 0.85,  # Natural grasslands
+        "322": 0.80,  # Moors and heathland
+        "324": 0.75,  # Transitional woodland-shrub
+        "411": 0.90,  # Inland marshes
+        "412": 0.90,  # Peat bogs
+        "421": 0.85,  # Salt marshes
+        "511": 0.70,  # Water courses
+        "512": 0.75,  # Water bodies
+        # Medium value
+        "211": 0.60,  # Non-irrigated arable land
+        "222": 0.55,  # Fruit trees and berry plantations
+        "231": 0.50,  # Pastures
+        # Low value
+        "111": 0.20,  # Continuous urban fabric
+        "112": 0.25,  # Discontinuous urban fabric
+        "121": 0.30,  # Industrial or commercial units
+        "122": 0.15,  # Road and rail networks
+        "131": 0.10,  # Mineral extraction sites
+        "133": 0.05,  # Construction sites
+    },
+    dtype="float64",
+)
+
+# Water regulation coefficients (higher = better water retention)
+WATER_REGULATION_COEFFICIENTS = pd.Series(
+    {
+        "311": 0.95,  # Forests (high retention)
+        "312": 0.95,
+        "313": 0.95,
+        "321": 0.80,  # Grasslands
+        "322": 0.75,  # Heathland
+        "411": 0.90,  # Wetlands (very high)
+        "412": 0.90,
+        "421": 0.85,  # Salt marshes
+        "211": 0.50,  # Arable (moderate)
+        "231": 0.60,  # Pastures
+        "111": 0.10,  # Urban (low, high runoff)
+        "112": 0.15,
+        "121": 0.20,
+        "122": 0.05,  # Roads (very low)
+    },
+    dtype="float64",
+)
+
+# Erosion risk coefficients (higher = more risk)
+EROSION_RISK_COEFFICIENTS = pd.Series(
+    {
+        "131": 0.95,  # Mineral extraction (very high)
+        "133": 0.90,  # Construction sites
+        "211": 0.70,  # Arable land (high)
+        "222": 0.60,  # Orchards
+        "231": 0.50,  # Pastures (moderate)
+        "311": 0.15,  # Forests (low)
+        "312": 0.15,
+        "313": 0.15,
+        "321": 0.25,  # Grasslands (low-moderate)
+        "322": 0.30,  # Heathland
+        "411": 0.20,  # Wetlands (low)
+        "111": 0.40,  # Urban (moderate, but sealed)
+        "112": 0.35,
+        "121": 0.45,
+        "122": 0.50,  # Roads
+    },
+    dtype="float64",
+)
+
+# Land cover area categories of the land use and carbon KPIs
+_KPI_CATEGORIES = {
+    "forest": FOREST_CLASSES,
+    "impervious": IMPERVIOUS_CLASSES,
+    "natural_habitat": NATURAL_HABITAT_CLASSES,
+}
+
+# Every class code with a coefficient. Summaries are mapped to positions in this
+# index once and values are gathered from the aligned arrays below, whose trailing
+# slot covers unlisted codes (``get_indexer`` gives -1).
+_CODE_INDEX = SERVICE_COEFFICIENTS.index.union(WATER_REGULATION_COEFFICIENTS.index).union(
+    EROSION_RISK_COEFFICIENTS.index
+)
+
+
+def _coefficient_array(coefficients: pd.Series, default: float) -> np.ndarray:
+    """Align ``coefficients`` with ``_CODE_INDEX``, appending ``default`` as the last slot."""
+    return np.append(coefficients.reindex(_CODE_INDEX).fillna(default).to_numpy(), default)
+
+
+# Unlisted classes default to medium value / moderate retention / moderate risk
+_SERVICE_COEFF = _coefficient_array(SERVICE_COEFFICIENTS, 0.30)
+_WATER_COEFF = _coefficient_array(WATER_REGULATION_COEFFICIENTS, 0.40)
+_EROSION_COEFF = _coefficient_array(EROSION_RISK_COEFFICIENTS, 0.50)
+
+# Layout of ``EnvironmentalKPIs.as_dict``: (section, ((output key, attribute), ...))
+_KPI_SECTIONS: tuple[tuple[str, tuple[tuple[str, str], ...]], ...] = (
+    (
+        "emissions_climate",
+        (
+            ("ghg_emissions_intensity_tco2e_per_mw", "ghg_emissions_intensity"),
+            ("carbon_sequestration_potential_tco2e_per_ha", "carbon_sequestration_potential"),
+            ("net_carbon_balance_tco2e", "net_carbon_balance"),
+        ),
+    ),
+    (
+        "land_use",
+        (
+            ("land_use_efficiency_mw_per_ha", "land_use_efficiency"),
+            ("impervious_surface_ratio", "impervious_surface_ratio"),
+            ("natural_habitat_ratio", "natural_habitat_ratio"),
+        ),
+    ),
+    (
+        "biodiversity",
+        (
+            ("habitat_fragmentation_index", "habitat_fragmentation_index"),
+            ("patch_density_per_100ha", "patch_density"),
+            ("edge_density_m_per_ha", "edge_density"),
+            ("shannon_diversity_index", "shannon_diversity_index"),
+            ("connectivity_index", "connectivity_index"),
+        ),
+    ),
+    (
+        "ecosystem_services",
+        (
+            ("ecosystem_service_value_index", "ecosystem_service_value_index"),
+            ("water_regulation_capacity", "water_regulation_capacity"),
+            ("soil_erosion_risk", "soil_erosion_risk"),
+        ),
+    ),
+    (
+        "air_quality",
+        (
+            ("air_quality_impact_index", "air_quality_impact_index"),
+            ("particulate_matter_potential", "particulate_matter_potential"),
+        ),
+    ),
+    (
+        "resource_efficiency",
+        (
+            ("resource_efficiency_index", "resource_efficiency_index"),
+            ("renewable_energy_ratio", "renewable_energy_ratio"),
+        ),
+    ),
+)
+
+
+@dataclass(slots=True, frozen=True)
 class EnvironmentalKPIs:
     """Comprehensive environmental KPI results."""
 
@@ -59,93 +225,143 @@ class EnvironmentalKPIs:
     def as_dict(self) -> dict[str, Any]:
         """Convert KPIs to dictionary."""
         return {
-            "emissions_climate": {
-                "ghg_emissions_intensity_tco2e_per_mw": self.ghg_emissions_intensity,
-                "carbon_sequestration_potential_tco2e_per_ha": self.carbon_sequestration_potential,
-                "net_carbon_balance_tco2e": self.net_carbon_balance,
-            },
-            "land_use": {
-                "land_use_efficiency_mw_per_ha": self.land_use_efficiency,
-                "impervious_surface_ratio": self.impervious_surface_ratio,
-                "natural_habitat_ratio": self.natural_habitat_ratio,
-            },
-            "biodiversity": {
-                "habitat_fragmentation_index": self.habitat_fragmentation_index,
-                "patch_density_per_100ha": self.patch_density,
-                "edge_density_m_per_ha": self.edge_density,
-                "shannon_diversity_index": self.shannon_diversity_index,
-                "connectivity_index": self.connectivity_index,
-            },
-            "ecosystem_services": {
-                "ecosystem_service_value_index": self.ecosystem_service_value_index,
-                "water_regulation_capacity": self.water_regulation_capacity,
-                "soil_erosion_risk": self.soil_erosion_risk,
-            },
-            "air_quality": {
-                "air_quality_impact_index": self.air_quality_impact_index,
-                "particulate_matter_potential": self.particulate_matter_potential,
-            },
-            "resource_efficiency": {
-                "resource_efficiency_index": self.resource_efficiency_index,
-                "renewable_energy_ratio": self.renewable_energy_ratio,
-            },
+            section: {key: getattr(self, attr) for key, attr in entries}
+            for section, entries in _KPI_SECTIONS
         }
 
+    def as_flat_array(self) -> np.ndarray:
+        """Return all KPIs as a float64 vector in field order (see ``KPI_FIELD_NAMES``)."""
+        return np.fromiter(
+            (getattr(self, name) for name in KPI_FIELD_NAMES),
+            dtype=np.float64,
+            count=len(KPI_FIELD_NAMES),
+        )
 
-def calculate_habitat_fragmentation_index(
-    land_cover_gdf: gpd.GeoDataFrame, class_field: str = "class_code"
+
+# Order of ``EnvironmentalKPIs.as_flat_array``
+KPI_FIELD_NAMES = tuple(field.name for field in fields(EnvironmentalKPIs))
+
+
+def _code_ids(codes: np.ndarray) -> np.ndarray:
+    """Return positions of ``codes`` in ``_CODE_INDEX`` (-1 for unlisted codes)."""
+    return _CODE_INDEX.get_indexer(codes)
+
+
+def _weighted_coefficient(
+    code_ids: np.ndarray,
+    areas: np.ndarray,
+    coefficients: np.ndarray,
+    fallback: float,
 ) -> float:
-    """
-    Calculate habitat fragmentation index using landscape ecology metrics.
+    """Area-weighted mean of per-class coefficients; ``fallback`` when there is no area."""
+    total_area = areas.sum()
+    if total_area <= 0:
+        return fallback
+    return float(np.dot(areas, coefficients[code_ids]) / total_area)
 
-    Based on:
-    - McGarigal, K., & Marks, B. J. (1995). FRAGSTATS: spatial pattern analysis
-      program for quantifying landscape structure.
 
-    Returns:
-        Fragmentation index (0-1), where 1 = highly fragmented
+def _patches_per_class(land_cover_gdf: gpd.GeoDataFrame, class_field: str) -> int:
     """
-    if land_cover_gdf.empty:
-        return 0.0
+    Count patches as connected components of each class's unioned geometry.
+
+    Works on the raw geometry array per class (no ``dissolve`` GeoDataFrame).
+    """
+    geoms = np.asarray(land_cover_gdf.geometry.values)
+    groups = land_cover_gdf.groupby(class_field, sort=False).indices
+    return int(
+        sum(
+            shapely.get_num_geometries(shapely.union_all(geoms[idx]))
+            for idx in groups.values()
+        )
+    )
 
-    # Calculate number of patches (unique contiguous areas)
-    dissolved = land_cover_gdf.dissolve(by=class_field)
-    num_patches = len(dissolved)
 
-    # Calculate total area
-    total_area_ha = land_cover_gdf.geometry.area.sum() / 10_000
+def _landscape_stats(
+    land_cover_gdf: gpd.GeoDataFrame,
+    class_field: str | None,
+    connected_patches: bool = False,
+) -> tuple[int, float, float]:
+    """
+    Return ``(num_patches, total_area_ha, total_perimeter_m)`` for a land cover layer.
 
+    Patches are counted as distinct classes (what ``dissolve(by=class_field)``
+    yielded), without unioning any geometry, unless ``connected_patches`` asks for
+    connected components per class. ``class_field=None`` skips the count.
+    """
+    if not class_field:
+        num_patches = 0
+    elif connected_patches:
+        num_patches = _patches_per_class(land_cover_gdf, class_field)
+    else:
+        num_patches = int(land_cover_gdf[class_field].nunique())
+    geoms = np.asarray(land_cover_gdf.geometry.values)
+    total_area_ha = float(np.nansum(shapely.area(geoms))) / 10_000
+    # shapely.length of a polygon is its perimeter (no boundary GeometryArray)
+    total_perimeter_m = float(np.nansum(shapely.length(geoms)))
+    return num_patches, total_area_ha, total_perimeter_m
+
+
+def _fragstats_metrics(
+    num_patches: int, total_area_ha: float, total_perimeter_m: float
+) -> dict[str, float]:
+    """Turn ``_landscape_stats`` totals into fragmentation, patch and edge density."""
     if total_area_ha <= 0:
-        return 0.0
+        return {"fragmentation_index": 0.0, "patch_density": 0.0, "edge_density": 0.0}
 
     # Patch density (patches per 100 ha)
     patch_density = (num_patches / total_area_ha) * 100
+    return {
+        # Normalize to 0-1 scale (assuming max reasonable density of 50 patches/100ha)
+        "fragmentation_index": min(1.0, patch_density / 50.0),
+        "patch_density": patch_density,
+        "edge_density": total_perimeter_m / total_area_ha,
+    }
 
-    # Normalize to 0-1 scale (assuming max reasonable density of 50 patches/100ha)
-    fragmentation_index = min(1.0, patch_density / 50.0)
 
-    return fragmentation_index
+def _fragstats_bundle(
+    land_cover_gdf: gpd.GeoDataFrame,
+    class_field: str | None,
+    connected_patches: bool = False,
+) -> dict[str, float]:
+    """Compute fragmentation index, patch density and edge density in one geometry pass."""
+    if land_cover_gdf.empty:
+        return _fragstats_metrics(0, 0.0, 0.0)
+    return _fragstats_metrics(
+        *_landscape_stats(land_cover_gdf, class_field, connected_patches)
+    )
 
 
-def calculate_patch_density(
-    land_cover_gdf: gpd.GeoDataFrame, class_field: str = "class_code"
+def calculate_habitat_fragmentation_index(
+    land_cover_gdf: gpd.GeoDataFrame,
+    class_field: str = "class_code",
+    connected_patches: bool = False,
 ) -> float:
     """
-    Calculate patch density (number of patches per 100 hectares).
+    Calculate habitat fragmentation index using landscape ecology metrics.
 
-    Based on FRAGSTATS methodology.
+    Based on:
+    - McGarigal, K., & Marks, B. J. (1995). FRAGSTATS: spatial pattern analysis
+      program for quantifying landscape structure.
+
+    Returns:
+        Fragmentation index (0-1), where 1 = highly fragmented
     """
-    if land_cover_gdf.empty:
-        return 0.0
+    metrics = _fragstats_bundle(land_cover_gdf, class_field, connected_patches)
+    return metrics["fragmentation_index"]
 
-    dissolved = land_cover_gdf.dissolve(by=class_field)
-    num_patches = len(dissolved)
-    total_area_ha = land_cover_gdf.geometry.area.sum() / 10_000
 
-    if total_area_ha <= 0:
-        return 0.0
+def calculate_patch_density(
+    land_cover_gdf: gpd.GeoDataFrame,
+    class_field: str = "class_code",
+    connected_patches: bool = False,
+) -> float:
+    """
+    Calculate patch density (number of patches per 100 hectares).
 
-    return (num_patches / total_area_ha) * 100
+    Based on FRAGSTATS methodology. By default each class counts as one patch;
+    ``connected_patches=True`` counts the connected components of every class.
+    """
+    return _fragstats_bundle(land_cover_gdf, class_field, connected_patches)["patch_density"]
 
 
 def calculate_edge_density(
@@ -156,21 +372,12 @@ def calculate_edge_density(
 
     Based on FRAGSTATS methodology.
     """
-    if land_cover_gdf.empty:
-        return 0.0
-
-    # Calculate total perimeter of all polygons
-    total_perimeter_m = land_cover_gdf.geometry.boundary.length.sum()
-    total_area_ha = land_cover_gdf.geometry.area.sum() / 10_000
-
-    if total_area_ha <= 0:
-        return 0.0
-
-    return total_perimeter_m / total_area_ha
+    # Total perimeter of all polygons; no patch count needed
+    return _fragstats_bundle(land_cover_gdf, None)["edge_density"]
 
 
 def calculate_shannon_diversity_index(
-    land_cover_summary: list[dict],
+    land_cover_summary: list[dict] | pd.DataFrame,
 ) -> float:
     """
     Calculate Shannon diversity index for land cover types.
@@ -184,24 +391,23 @@ def calculate_shannon_diversity_index(
     Returns:
         Shannon diversity index (0-1, normalized)
     """
-    if not land_cover_summary:
+    if len(land_cover_summary) == 0:
         return 0.0
 
-    total_area = sum(float(row.get("total_area_ha", 0)) for row in land_cover_summary)
+    _, areas = summary_arrays(land_cover_summary)
+    total_area = areas.sum()
     if total_area <= 0:
         return 0.0
 
     # Calculate proportions
-    proportions = [
-        float(row.get("total_area_ha", 0)) / total_area
-        for row in land_cover_summary
-    ]
+    proportions = areas / total_area
 
-    # Calculate Shannon index
-    shannon = -sum(p * np.log(p) for p in proportions if p > 0)
+    # Calculate Shannon index (empty classes contribute 0)
+    p = proportions[proportions > 0]
+    shannon = -float(np.sum(p * np.log(p)))
 
-    # Normalize to 0-1 (max value is ln(n), where n is number of classes)
-    max_shannon = np.log(len(proportions))
+    # Normalize to 0-1 (max value is ln(n), where n is number of classes present)
+    max_shannon = np.log(np.count_nonzero(areas))
     normalized = shannon / max_shannon if max_shannon > 0 else 0.0
 
     return float(normalized)
@@ -222,16 +428,21 @@ def calculate_connectivity_index(
     Returns:
         Connectivity index (0-1), where 1 = high connectivity
     """
+    from ..utils.geometry import compute_area_ha
+    from .biodiversity import compute_overlap_metrics_scalar
+    from .land_cover import KPI_CLASS_FIELDS, resolve_class_field
+
     if protected_areas.empty or land_cover_gdf.empty:
         return 0.0
 
-    # Calculate overlap with protected areas
-    overlap = gpd.overlay(protected_areas, aoi, how="intersection")
-    if overlap.empty:
+    # Area of protected sites intersecting the AOI (no attributes needed)
+    protected_area_ha = compute_overlap_metrics_scalar(aoi, protected_areas)[
+        "protected_overlap_ha"
+    ]
+    if protected_area_ha <= 0:
         return 0.0
 
-    protected_area_ha = overlap.geometry.area.sum() / 10_000
-    aoi_area_ha = aoi.geometry.area.sum() / 10_000
+    aoi_area_ha = compute_area_ha(aoi)
 
     if aoi_area_ha <= 0:
         return 0.0
@@ -240,22 +451,13 @@ def calculate_connectivity_index(
     protected_ratio = protected_area_ha / aoi_area_ha
 
     # Consider habitat continuity (natural habitats)
-    natural_classes = {"311", "312", "313", "321", "322", "324"}  # Forests, grasslands
-    
     # Try to find class field
-    class_field = None
-    for field in ["class_code", "code_18", "Code_18", "CODE_18", "clc_code"]:
-        if field in land_cover_gdf.columns:
-            class_field = field
-            break
-    
+    class_field = resolve_class_field(land_cover_gdf, KPI_CLASS_FIELDS)
+
     if class_field:
-        grouped = land_cover_gdf.groupby(class_field)
-        natural_area = sum(
-            group.geometry.area.sum() / 10_000
-            for name, group in grouped
-            if str(name) in natural_classes
-        )
+        mask = land_cover_gdf[class_field].astype(str).isin(NATURAL_VEGETATION_CLASSES).to_numpy()
+        natural_geoms = land_cover_gdf.geometry.values[mask]
+        natural_area = float(np.nansum(shapely.area(natural_geoms))) / 10_000
     else:
         natural_area = 0.0
 
@@ -268,7 +470,7 @@ def calculate_connectivity_index(
 
 
 def calculate_ecosystem_service_value(
-    land_cover_summary: list[dict],
+    land_cover_summary: list[dict] | pd.DataFrame,
 ) -> float:
     """
     Calculate relative ecosystem service value index.
@@ -280,53 +482,12 @@ def calculate_ecosystem_service_value(
     Returns:
         Ecosystem service value index (0-1)
     """
-    if not land_cover_summary:
-        return 0.0
-
-    # Ecosystem service coefficients (relative values, normalized 0-1)
-    # Based on TEEB and Costanza et al. (2014)
-    service_coefficients = {
-        # High value natural habitats
-        "311": 0.95,  # Broad-leaved forest
-        "312": 0.95,  # Coniferous forest
-        "313": 0.95,  # Mixed forest
-        "321": 0.85,  # Natural grasslands
-        "322": 0.80,  # Moors and heathland
-        "324": 0.75,  # Transitional woodland-shrub
-        "411": 0.90,  # Inland marshes
-        "412": 0.90,  # Peat bogs
-        "421": 0.85,  # Salt marshes
-        "511": 0.70,  # Water courses
-        "512": 0.75,  # Water bodies
-        # Medium value
-        "211": 0.60,  # Non-irrigated arable land
-        "222": 0.55,  # Fruit trees and berry plantations
-        "231": 0.50,  # Pastures
-        # Low value
-        "111": 0.20,  # Continuous urban fabric
-        "112": 0.25,  # Discontinuous urban fabric
-        "121": 0.30,  # Industrial or commercial units
-        "122": 0.15,  # Road and rail networks
-        "131": 0.10,  # Mineral extraction sites
-        "133": 0.05,  # Construction sites
-    }
-
-    total_area = sum(float(row.get("total_area_ha", 0)) for row in land_cover_summary)
-    if total_area <= 0:
-        return 0.0
-
-    weighted_value = 0.0
-    for row in land_cover_summary:
-        class_code = str(row.get("class_code", ""))
-        area_ha = float(row.get("total_area_ha", 0))
-        coefficient = service_coefficients.get(class_code, 0.30)  # Default medium
-        weighted_value += (area_ha / total_area) * coefficient
-
-    return float(weighted_value)
+    codes, areas = summary_arrays(land_cover_summary)
+    return _weighted_coefficient(_code_ids(codes), areas, _SERVICE_COEFF, fallback=0.0)
 
 
 def calculate_water_regulation_capacity(
-    land_cover_summary: list[dict],
+    land_cover_summary: list[dict] | pd.DataFrame,
 ) -> float:
     """
     Calculate water regulation capacity index.
@@ -338,43 +499,12 @@ def calculate_water_regulation_capacity(
     Returns:
         Water regulation capacity (0-1)
     """
-    if not land_cover_summary:
-        return 0.0
-
-    # Water regulation coefficients (higher = better water retention)
-    regulation_coefficients = {
-        "311": 0.95,  # Forests (high retention)
-        "312": 0.95,
-        "313": 0.95,
-        "321": 0.80,  # Grasslands
-        "322": 0.75,  # Heathland
-        "411": 0.90,  # Wetlands (very high)
-        "412": 0.90,
-        "421": 0.85,  # Salt marshes
-        "211": 0.50,  # Arable (moderate)
-        "231": 0.60,  # Pastures
-        "111": 0.10,  # Urban (low, high runoff)
-        "112": 0.15,
-        "121": 0.20,
-        "122": 0.05,  # Roads (very low)
-    }
-
-    total_area = sum(float(row.get("total_area_ha", 0)) for row in land_cover_summary)
-    if total_area <= 0:
-        return 0.0
-
-    weighted_capacity = 0.0
-    for row in land_cover_summary:
-        class_code = str(row.get("class_code", ""))
-        area_ha = float(row.get("total_area_ha", 0))
-        coefficient = regulation_coefficients.get(class_code, 0.40)
-        weighted_capacity += (area_ha / total_area) * coefficient
-
-    return float(weighted_capacity)
+    codes, areas = summary_arrays(land_cover_summary)
+    return _weighted_coefficient(_code_ids(codes), areas, _WATER_COEFF, fallback=0.0)
 
 
 def calculate_soil_erosion_risk(
-    land_cover_summary: list[dict],
+    land_cover_summary: list[dict] | pd.DataFrame,
     slope_data: gpd.GeoDataFrame | None = None,
 ) -> float:
     """
@@ -387,46 +517,15 @@ def calculate_soil_erosion_risk(
     Returns:
         Soil erosion risk (0-1), where 1 = high risk
     """
-    if not land_cover_summary:
-        return 0.5  # Default moderate risk
-
-    # Erosion risk coefficients (higher = more risk)
-    erosion_risk_coefficients = {
-        "131": 0.95,  # Mineral extraction (very high)
-        "133": 0.90,  # Construction sites
-        "211": 0.70,  # Arable land (high)
-        "222": 0.60,  # Orchards
-        "231": 0.50,  # Pastures (moderate)
-        "311": 0.15,  # Forests (low)
-        "312": 0.15,
-        "313": 0.15,
-        "321": 0.25,  # Grasslands (low-moderate)
-        "322": 0.30,  # Heathland
-        "411": 0.20,  # Wetlands (low)
-        "111": 0.40,  # Urban (moderate, but sealed)
-        "112": 0.35,
-        "121": 0.45,
-        "122": 0.50,  # Roads
-    }
-
-    total_area = sum(float(row.get("total_area_ha", 0)) for row in land_cover_summary)
-    if total_area <= 0:
-        return 0.5
-
-    weighted_risk = 0.0
-    for row in land_cover_summary:
-        class_code = str(row.get("class_code", ""))
-        area_ha = float(row.get("total_area_ha", 0))
-        coefficient = erosion_risk_coefficients.get(class_code, 0.50)
-        weighted_risk += (area_ha / total_area) * coefficient
-
-    return float(weighted_risk)
+    codes, areas = summary_arrays(land_cover_summary)
+    # Empty summaries default to moderate risk
+    return _weighted_coefficient(_code_ids(codes), areas, _EROSION_COEFF, fallback=0.5)
 
 
 def calculate_comprehensive_kpis(
     aoi: gpd.GeoDataFrame,
     land_cover_gdf: gpd.GeoDataFrame,
-    land_cover_summary: list[dict],
+    land_cover_summary: list[dict] | pd.DataFrame,
     protected_areas: gpd.GeoDataFrame,
     emission_result: dict[str, float],
     project_capacity_mw: float,
@@ -445,7 +544,17 @@ def calculate_comprehensive_kpis(
     Returns:
         EnvironmentalKPIs object with all calculated indicators
     """
-    aoi_area_ha = aoi.geometry.area.sum() / 10_000
+    from ..utils.geometry import compute_area_ha
+    from .land_cover import KPI_CLASS_FIELDS, resolve_class_field
+
+    aoi_area_ha = compute_area_ha(aoi)
+    # Summary converted to codes/areas (and coefficient ids) once
+    codes, areas = summary_arrays(land_cover_summary)
+    code_ids = _code_ids(codes)
+    category_totals = category_areas(codes, areas, _KPI_CATEGORIES)
+    forest_area_ha = category_totals["forest"]
+    impervious_area = category_totals["impervious"]
+    natural_area = category_totals["natural_habitat"]
 
     # Emissions & Climate KPIs
     total_ghg = (
@@ -455,12 +564,6 @@ def calculate_comprehensive_kpis(
     ghg_intensity = total_ghg / project_capacity_mw if project_capacity_mw > 0 else 0.0
 
     # Carbon sequestration (based on forest area)
-    forest_classes = {"311", "312", "313"}
-    forest_area_ha = sum(
-        float(row.get("total_area_ha", 0))
-        for row in land_cover_summary
-        if str(row.get("class_code")) in forest_classes
-    )
     # Average sequestration: ~5 tCO2e/ha/year for European forests
     carbon_sequestration = forest_area_ha * 5.0
     net_carbon_balance = (
@@ -473,37 +576,20 @@ def calculate_comprehensive_kpis(
     )
 
     # Impervious surfaces (urban, roads, etc.)
-    impervious_classes = {"111", "112", "121", "122", "131", "133"}
-    impervious_area = sum(
-        float(row.get("total_area_ha", 0))
-        for row in land_cover_summary
-        if str(row.get("class_code")) in impervious_classes
-    )
     impervious_ratio = impervious_area / aoi_area_ha if aoi_area_ha > 0 else 0.0
 
     # Natural habitat ratio
-    natural_classes = {"311", "312", "313", "321", "322", "324", "411", "412", "421"}
-    natural_area = sum(
-        float(row.get("total_area_ha", 0))
-        for row in land_cover_summary
-        if str(row.get("class_code")) in natural_classes
-    )
     natural_ratio = natural_area / aoi_area_ha if aoi_area_ha > 0 else 0.0
 
     # Biodiversity KPIs
     # Find the class field in land_cover_gdf
-    class_field = None
-    for field in ["class_code", "code_18", "Code_18", "CODE_18", "clc_code", "CLC_CODE"]:
-        if field in land_cover_gdf.columns:
-            class_field = field
-            break
+    class_field = resolve_class_field(land_cover_gdf, KPI_CLASS_FIELDS)
 
     if class_field:
-        fragmentation_index = calculate_habitat_fragmentation_index(
-            land_cover_gdf, class_field
-        )
-        patch_density = calculate_patch_density(land_cover_gdf, class_field)
-        edge_density = calculate_edge_density(land_cover_gdf, class_field)
+        fragstats = _fragstats_bundle(land_cover_gdf, class_field)
+        fragmentation_index = fragstats["fragmentation_index"]
+        patch_density = fragstats["patch_density"]
+        edge_density = fragstats["edge_density"]
     else:
         # Fallback if no class field found
         logger.warning("No class field found in land cover data, using defaults for fragmentation metrics")
@@ -515,10 +601,10 @@ def calculate_comprehensive_kpis(
         aoi, protected_areas, land_cover_gdf
     )
 
-    # Ecosystem Services KPIs
-    ecosystem_service_value = calculate_ecosystem_service_value(land_cover_summary)
-    water_regulation = calculate_water_regulation_capacity(land_cover_summary)
-    soil_erosion_risk = calculate_soil_erosion_risk(land_cover_summary)
+    # Ecosystem Services KPIs (sharing the code ids above)
+    ecosystem_service_value = _weighted_coefficient(code_ids, areas, _SERVICE_COEFF, fallback=0.0)
+    water_regulation = _weighted_coefficient(code_ids, areas, _WATER_COEFF, fallback=0.0)
+    soil_erosion_risk = _weighted_coefficient(code_ids, areas, _EROSION_COEFF, fallback=0.5)
 
     # Air Quality KPIs (simplified - would need actual emission data)
     # Based on land use and project type
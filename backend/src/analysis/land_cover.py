@@ -3,9 +3,15 @@
 from __future__ import annotations
 
 import geopandas as gpd
+import numpy as np
+import pandas as pd
+import shapely
 
+from ..utils.geometry import EQUAL_AREA_CRS
 
-CLASS_FIELDS = [
+
+# Columns holding numeric CORINE codes
+CODE_FIELDS = [
     "code_18",
     "Code_18",
     "CODE_18",
@@ -13,29 +19,49 @@ CLASS_FIELDS = [
     "CLC_CODE",
     "CLC18",
     "CLC2018",
-    "legend",
-    "LABEL3",
 ]
 
+CLASS_FIELDS = [*CODE_FIELDS, "legend", "LABEL3"]
+
+# KPI inputs may already carry a normalized ``class_code`` column. Text label
+# columns are left out: the KPIs match class codes, so labels-only layers use the
+# KPI defaults instead.
+KPI_CLASS_FIELDS = ["class_code", *CODE_FIELDS]
+
+
+def resolve_class_field(
+    gdf: gpd.GeoDataFrame, candidates: list[str] = CLASS_FIELDS
+) -> str | None:
+    """Return the first candidate class column present in ``gdf``, or None."""
+    columns = gdf.columns
+    return next((field for field in candidates if field in columns), None)
+
 
 def summarize_land_cover(gdf: gpd.GeoDataFrame) -> list[dict]:
     if gdf.empty:
         return []
 
-    class_field = next((field for field in CLASS_FIELDS if field in gdf.columns), None)
+    class_field = resolve_class_field(gdf)
     if not class_field:
         raise ValueError("Unable to identify CORINE class column.")
 
-    data = gdf.copy()
-    data["area_ha"] = data.geometry.area / 10_000
+    codes = gdf[class_field]
+    # Areas in an equal-area CRS; only the geometry column is reprojected
+    geometry = gdf.geometry
+    if gdf.crs is not None and gdf.crs.is_geographic:
+        geometry = geometry.to_crs(EQUAL_AREA_CRS)
+    areas_ha = np.nan_to_num(shapely.area(np.asarray(geometry.values))) / 10_000
 
-    summary_df = (
-        data.groupby(class_field)
-        .agg(total_area_ha=("area_ha", "sum"))
-        .reset_index()
-        .sort_values("total_area_ha", ascending=False)
+    # Integerize class codes with a hash-based factorize (missing codes -> -1),
+    # then sum areas per code id with a weighted bincount
+    code_ids, class_codes = pd.factorize(codes, sort=True)
+    has_code = code_ids >= 0
+    totals = np.bincount(
+        code_ids[has_code], weights=areas_ha[has_code], minlength=len(class_codes)
     )
+    order = np.argsort(-totals, kind="stable")
 
-    summary_df = summary_df.rename(columns={class_field: "class_code"})
-    return summary_df.to_dict(orient="records")
-
+    return [
+        {"class_code": code, "total_area_ha": total}
+        for code, total in zip(class_codes[order].tolist(), totals[order].tolist(), strict=True)
+    ]
@@ -0,0 +1,84 @@
+"""CORINE land cover class groups shared by the KPIs and model feature builders.
+
+Kept free of GeoPandas so that summary-only callers (and ``kpis``) can import it
+cheaply.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+import numpy as np
+import pandas as pd
+
+# Urban fabric, industrial/commercial units, roads and other sealed surfaces
+IMPERVIOUS_CLASSES = frozenset({"111", "112", "121", "122", "131", "133"})
+
+# Arable land, permanent crops and pastures
+AGRI_CLASSES = frozenset({"211", "212", "213", "221", "222", "223", "231"})
+
+# Heterogeneous agricultural areas
+HETEROGENEOUS_AGRI_CLASSES = frozenset({"241", "242", "243"})
+
+# Forests (carbon sequestration)
+FOREST_CLASSES = frozenset({"311", "312", "313"})
+
+# Forests plus grassland and shrub vegetation, counted towards landscape connectivity
+NATURAL_VEGETATION_CLASSES = FOREST_CLASSES | {"321", "322", "324"}
+
+# Inland and coastal wetlands
+WETLAND_CLASSES = frozenset({"411", "412", "421"})
+
+# Natural and semi-natural habitats, including wetlands
+NATURAL_HABITAT_CLASSES = NATURAL_VEGETATION_CLASSES | WETLAND_CLASSES
+
+# Wetlands and water bodies
+WATER_CLASSES = WETLAND_CLASSES | {"511", "512"}
+
+
+def summary_arrays(
+    land_cover_summary: list[dict] | pd.DataFrame,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return the class codes (as strings) and areas (ha) of a land cover summary.
+
+    Accepts either the list-of-records summary or a DataFrame with ``class_code``
+    and ``total_area_ha`` columns; the latter is converted column-wise.
+    """
+    if isinstance(land_cover_summary, pd.DataFrame):
+        if land_cover_summary.empty:
+            return np.empty(0, dtype=object), np.empty(0, dtype=np.float64)
+        codes = land_cover_summary["class_code"].astype(str).to_numpy(dtype=object)
+        areas = land_cover_summary["total_area_ha"].to_numpy(dtype=np.float64)
+        return codes, areas
+
+    codes = np.array(
+        [str(row.get("class_code", "")) for row in land_cover_summary], dtype=object
+    )
+    areas = np.fromiter(
+        (float(row.get("total_area_ha", 0)) for row in land_cover_summary),
+        dtype=np.float64,
+        count=len(land_cover_summary),
+    )
+    return codes, areas
+
+
+def category_areas(
+    codes: np.ndarray,
+    areas: np.ndarray,
+    categories: Mapping[str, frozenset[str]],
+) -> dict[str, float]:
+    """
+    Sum ``areas`` per named class group; groups may share codes.
+
+    The codes are factorized once and the per-code totals classified with a single
+    (code x group) membership product.
+    """
+    code_ids, unique_codes = pd.factorize(codes)
+    totals_by_code = np.bincount(code_ids, weights=areas, minlength=len(unique_codes))
+    membership = np.array(
+        [[code in classes for classes in categories.values()] for code in unique_codes],
+        dtype=np.float64,
+    ).reshape(len(unique_codes), len(categories))
+    totals = totals_by_code @ membership
+    return dict(zip(categories, totals.tolist(), strict=True))
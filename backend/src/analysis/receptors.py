@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import cache, lru_cache
 from pathlib import Path
+from typing import Any
 
 import geopandas as gpd
+import numpy as np
 import pandas as pd
+import shapely
+from geopandas.sindex import SpatialIndex
+from pyproj import CRS, Transformer
 from shapely.geometry import Point
 
 from ..logging_utils import get_logger
@@ -14,8 +24,24 @@ from ..logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# Point-only layers queried by at most this many AOIs skip the spatial index: a
+# brute-force planar scan of the coordinates is cheaper than building the index
+PLANAR_SCAN_MAX_AOIS = 4
 
-@dataclass
+# Latitude band covered by the UTM zones; outside it the zone grid does not apply
+UTM_LAT_MIN = -80
+UTM_LAT_MAX = 84
+
+# Receptor layers kept in their projected (or combined) form between analyses
+PROJECTED_LAYER_CACHE_SIZE = 8
+
+_projected_layers: OrderedDict[
+    tuple[tuple[int, ...], Any], tuple[tuple[weakref.ref, ...], gpd.GeoDataFrame]
+] = OrderedDict()
+_projected_layers_lock = threading.RLock()
+
+
+@dataclass(slots=True, frozen=True)
 class ReceptorDistance:
     """Distance measurement to a sensitive receptor."""
 
@@ -65,176 +91,427 @@ def calculate_distance_to_receptors(
     Returns:
         ReceptorAnalysis with distance measurements
     """
-    # Get AOI centroid
-    aoi_union = aoi.geometry.unary_union
-    aoi_centroid = aoi_union.centroid
-
-    # Ensure centroid is in same CRS as AOI
-    if aoi.crs:
-        centroid_gdf = gpd.GeoDataFrame(geometry=[aoi_centroid], crs=aoi.crs)
-        if aoi.crs != "EPSG:4326":
-            centroid_gdf = centroid_gdf.to_crs("EPSG:4326")
-        aoi_centroid = centroid_gdf.geometry.iloc[0]
-
-    analysis = ReceptorAnalysis(aoi_centroid=aoi_centroid)
-    all_distances: list[ReceptorDistance] = []
-
-    # Combine protected areas: prefer regional (Natura 2000), fallback to global (WDPA)
-    combined_protected = None
-    if protected_areas is not None and not protected_areas.empty:
-        combined_protected = protected_areas.copy()
-        if protected_areas_global is not None and not protected_areas_global.empty:
-            # Ensure same CRS
-            if combined_protected.crs != protected_areas_global.crs:
-                protected_areas_global = protected_areas_global.to_crs(combined_protected.crs)
-            # Combine datasets
-            combined_protected = gpd.GeoDataFrame(
-                pd.concat([combined_protected, protected_areas_global], ignore_index=True),
-                crs=combined_protected.crs
-            )
-    elif protected_areas_global is not None and not protected_areas_global.empty:
-        combined_protected = protected_areas_global.copy()
+    # Distances are measured in a metric CRS (the AOI's UTM zone)
+    metric_crs = _metric_crs(aoi)
+
+    # The AOI's features are analysed as one area around their joint centroid
+    centroid_m = _area_weighted_centroid(_to_crs(aoi, metric_crs).geometry.values)
+    return _analyse_centroids(
+        np.array([centroid_m], dtype=object),
+        metric_crs,
+        protected_areas=protected_areas,
+        protected_areas_global=protected_areas_global,
+        settlements=settlements,
+        water_bodies=water_bodies,
+        max_distance_km=max_distance_km,
+    )[0]
+
+
+def calculate_distances_batch(
+    aois: gpd.GeoDataFrame,
+    protected_areas: gpd.GeoDataFrame | None = None,
+    protected_areas_global: gpd.GeoDataFrame | None = None,
+    settlements: gpd.GeoDataFrame | None = None,
+    water_bodies: gpd.GeoDataFrame | None = None,
+    max_distance_km: float = 50.0,
+) -> list[ReceptorAnalysis]:
+    """
+    Calculate distances from several AOIs (one per row) to sensitive receptors.
+
+    Each receptor layer is projected and indexed once for the whole batch, and the
+    nearest receptor of every AOI centroid comes from a single spatial-index query per
+    layer (point layers queried by a few AOIs are scanned directly instead).
+    Distances are measured in the UTM zone estimated for all AOIs together.
+
+    Returns:
+        One ReceptorAnalysis per row of ``aois``, in row order
+    """
+    metric_crs = _metric_crs(aois)
+    return _analyse_centroids(
+        np.asarray(_to_crs(aois, metric_crs).geometry.centroid.values),
+        metric_crs,
+        protected_areas=protected_areas,
+        protected_areas_global=protected_areas_global,
+        settlements=settlements,
+        water_bodies=water_bodies,
+        max_distance_km=max_distance_km,
+    )
+
+
+def _area_weighted_centroid(geometries: np.ndarray) -> Point:
+    """
+    Centroid of several geometries taken together, without unioning them.
+
+    Equals the centroid of the union for disjoint polygons; overlapping parts are
+    weighted once per feature. AOIs without area fall back to the union centroid.
+    """
+    geometries = geometries[~shapely.is_missing(geometries) & ~shapely.is_empty(geometries)]
+    if len(geometries) == 1:
+        return shapely.centroid(geometries[0])
+    areas = shapely.area(geometries)
+    if not areas.sum() > 0:
+        return shapely.centroid(shapely.union_all(geometries))
+    centroids = shapely.centroid(geometries)
+    return Point(
+        np.average(shapely.get_x(centroids), weights=areas),
+        np.average(shapely.get_y(centroids), weights=areas),
+    )
+
+
+def _analyse_centroids(
+    points: np.ndarray,
+    metric_crs: Any,
+    protected_areas: gpd.GeoDataFrame | None,
+    protected_areas_global: gpd.GeoDataFrame | None,
+    settlements: gpd.GeoDataFrame | None,
+    water_bodies: gpd.GeoDataFrame | None,
+    max_distance_km: float,
+) -> list[ReceptorAnalysis]:
+    """Find receptors around AOI centroids given in ``metric_crs`` (one analysis per point)."""
+    max_distance_m = max_distance_km * 1000
+
+    # Report the centroids in geographic coordinates
+    centroids = _to_lonlat(points, metric_crs) if metric_crs is not None else points
+    analyses = [ReceptorAnalysis(aoi_centroid=centroid) for centroid in centroids]
 
     # Calculate distance to protected areas (combined regional + global)
-    if combined_protected is not None and not combined_protected.empty:
-        # Try Natura 2000 field names first, then WDPA field names
-        name_field = "SITENAME" if "SITENAME" in combined_protected.columns else (
-            "NAME" if "NAME" in combined_protected.columns else "name"
+    combined_protected = _combine_protected_areas(
+        protected_areas, protected_areas_global, metric_crs
+    )
+    if combined_protected is not None:
+        name_field, id_field = _protected_area_fields(combined_protected.columns)
+        index = _receptor_index(combined_protected, len(points))
+        # Nearest and all protected areas within max distance, from one query
+        nearest, within = _find_receptors(
+            points, combined_protected, index, "protected_area", max_distance_m,
+            name_field, id_field,
         )
-        id_field = "SITECODE" if "SITECODE" in combined_protected.columns else (
-            "WDPAID" if "WDPAID" in combined_protected.columns else "id"
+        for analysis, nearest_protected, all_protected in zip(
+            analyses, nearest, within, strict=True
+        ):
+            if nearest_protected:
+                analysis.nearest_protected_area = nearest_protected
+                analysis.all_receptors.append(nearest_protected)
+                analysis.all_receptors.extend(all_protected)
+
+    # Calculate distance to settlements and water bodies
+    for attr, receptor_type, layer in (
+        ("nearest_settlement", "settlement", settlements),
+        ("nearest_water_body", "water_body", water_bodies),
+    ):
+        if layer is None or layer.empty:
+            continue
+        receptors = _cached_to_crs(layer, metric_crs)
+        index = _receptor_index(receptors, len(points))
+        nearest = _nearest_receptors(
+            points, receptors, index, receptor_type, max_distance_m, "NAME", "NAME"
         )
-        
-        nearest_protected = _find_nearest_receptor(
-            aoi_centroid,
-            combined_protected,
-            "protected_area",
-            max_distance_km,
-            name_field=name_field,
-            id_field=id_field,
+        for analysis, receptor in zip(analyses, nearest, strict=True):
+            if receptor:
+                setattr(analysis, attr, receptor)
+                analysis.all_receptors.append(receptor)
+
+    logger.info(
+        "Calculated distances to %d receptors for %d AOI(s) (max distance: %.1f km)",
+        sum(len(analysis.all_receptors) for analysis in analyses),
+        len(analyses),
+        max_distance_km,
+    )
+
+    return analyses
+
+
+def _protected_area_fields(columns: pd.Index) -> tuple[str, str]:
+    """Pick the name and id fields: Natura 2000 field names first, then WDPA field names."""
+    name_field = "SITENAME" if "SITENAME" in columns else (
+        "NAME" if "NAME" in columns else "name"
+    )
+    id_field = "SITECODE" if "SITECODE" in columns else (
+        "WDPAID" if "WDPAID" in columns else "id"
+    )
+    return name_field, id_field
+
+
+def _combine_protected_areas(
+    protected_areas: gpd.GeoDataFrame | None,
+    protected_areas_global: gpd.GeoDataFrame | None,
+    crs: Any,
+) -> gpd.GeoDataFrame | None:
+    """
+    Combine protected areas in ``crs``: prefer regional (Natura 2000), fallback to global (WDPA).
+
+    A single source is only reprojected. When both are present, just their geometries
+    and name/id fields are reprojected and concatenated, not the full attribute tables.
+    """
+    sources = [
+        gdf
+        for gdf in (protected_areas, protected_areas_global)
+        if gdf is not None and not gdf.empty
+    ]
+    if not sources:
+        return None
+    # Without a metric CRS, fall back to the regional dataset's CRS
+    crs = crs if crs is not None else sources[0].crs
+    if len(sources) == 1:
+        return _cached_to_crs(sources[0], crs)
+
+    def combine() -> gpd.GeoDataFrame:
+        name_field, id_field = _protected_area_fields(
+            sources[0].columns.union(sources[1].columns)
         )
-        if nearest_protected:
-            analysis.nearest_protected_area = nearest_protected
-            all_distances.append(nearest_protected)
-
-            # Find all protected areas within max distance
-            all_protected = _find_all_receptors(
-                aoi_centroid,
-                combined_protected,
-                "protected_area",
-                max_distance_km,
-                name_field=name_field,
-                id_field=id_field,
+        parts = [
+            _to_crs(
+                gpd.GeoDataFrame(
+                    gdf[[field for field in (id_field, name_field) if field in gdf.columns]],
+                    geometry=gdf.geometry.values,
+                    crs=gdf.crs,
+                ),
+                crs,
             )
-            all_distances.extend(all_protected)
-
-    # Calculate distance to settlements
-    if settlements is not None and not settlements.empty:
-        nearest_settlement = _find_nearest_receptor(
-            aoi_centroid,
-            settlements,
-            "settlement",
-            max_distance_km,
-            name_field="NAME",
-            id_field="NAME",
-        )
-        if nearest_settlement:
-            analysis.nearest_settlement = nearest_settlement
-            all_distances.append(nearest_settlement)
-
-    # Calculate distance to water bodies
-    if water_bodies is not None and not water_bodies.empty:
-        nearest_water = _find_nearest_receptor(
-            aoi_centroid,
-            water_bodies,
-            "water_body",
-            max_distance_km,
-            name_field="NAME",
-            id_field="NAME",
+            for gdf in sources
+        ]
+        return gpd.GeoDataFrame(pd.concat(parts, ignore_index=True), crs=crs)
+
+    return _projected_layer(tuple(sources), crs, combine)
+
+
+@cache
+def _utm_crs(epsg: int) -> CRS:
+    """Return the (cached) CRS for a WGS 84 / UTM zone EPSG code."""
+    return CRS.from_epsg(epsg)
+
+
+def _metric_crs(gdf: gpd.GeoDataFrame) -> CRS | None:
+    """
+    Return the UTM CRS for ``gdf`` (None when it has no CRS).
+
+    Picks the same zone as ``estimate_utm_crs`` (the one containing the centre of
+    the bounds) arithmetically, with the CRS memoized per zone, instead of querying
+    the PROJ database each call. Centres on zone edges, the equator or beyond the
+    UTM latitude limits are still resolved by ``estimate_utm_crs``.
+    """
+    if gdf.crs is None:
+        return None
+    west, south, east, north = gdf.total_bounds
+    if not gdf.crs.is_geographic:
+        west, south, east, north = _lonlat_transformer(gdf.crs).transform_bounds(
+            west, south, east, north
         )
-        if nearest_water:
-            analysis.nearest_water_body = nearest_water
-            all_distances.append(nearest_water)
+    if west > east:
+        # Crosses the antimeridian
+        east += 360
+    lon = ((west + east) / 2 + 180) % 360 - 180
+    lat = (south + north) / 2
+    if lon % 6 == 0 or lat == 0 or not UTM_LAT_MIN < lat < UTM_LAT_MAX:
+        return gdf.estimate_utm_crs()
+    zone = int((lon + 180) // 6) + 1
+    return _utm_crs((32600 if lat > 0 else 32700) + zone)
+
+
+def _to_crs(gdf: gpd.GeoDataFrame, crs: Any) -> gpd.GeoDataFrame:
+    """Return ``gdf`` in ``crs`` (unchanged when ``crs`` is None or already matches)."""
+    if crs is None or gdf.crs == crs:
+        return gdf
+    return gdf.to_crs(crs)
+
+
+def _cached_to_crs(gdf: gpd.GeoDataFrame, crs: Any) -> gpd.GeoDataFrame:
+    """``_to_crs`` for receptor layers, reusing an earlier projection of the same layer."""
+    if crs is None or gdf.crs == crs:
+        return gdf
+    return _projected_layer((gdf,), crs, lambda: gdf.to_crs(crs))
+
+
+def _projected_layer(
+    sources: tuple[gpd.GeoDataFrame, ...],
+    crs: Any,
+    build: Callable[[], gpd.GeoDataFrame],
+) -> gpd.GeoDataFrame:
+    """
+    Return the layer ``build`` derives from ``sources`` in ``crs``, built once per sources.
 
-    analysis.all_receptors = all_distances
-    logger.info(
-        "Calculated distances to %d receptors (max distance: %.1f km)",
-        len(all_distances),
-        max_distance_km,
+    Entries are keyed by the identity of the source layers and the target CRS, so a
+    layer passed to another analysis (such as one handed out again by the dataset
+    cache) keeps its projected copy, and with it the copy's spatial index. Source
+    layers are treated as read-only. An entry is dropped when one of its sources is
+    garbage collected, and at most ``PROJECTED_LAYER_CACHE_SIZE`` entries are kept.
+    """
+    key = (tuple(id(source) for source in sources), crs)
+    with _projected_layers_lock:
+        entry = _projected_layers.get(key)
+        if entry is not None and all(
+            ref() is source for ref, source in zip(entry[0], sources, strict=True)
+        ):
+            _projected_layers.move_to_end(key)
+            return entry[1]
+
+    layer = build()
+
+    def evict(_: weakref.ref) -> None:
+        with _projected_layers_lock:
+            _projected_layers.pop(key, None)
+
+    with _projected_layers_lock:
+        _projected_layers[key] = (tuple(weakref.ref(source, evict) for source in sources), layer)
+        while len(_projected_layers) > PROJECTED_LAYER_CACHE_SIZE:
+            _projected_layers.popitem(last=False)
+    return layer
+
+
+@lru_cache(maxsize=16)
+def _lonlat_transformer(crs: Any) -> Transformer:
+    """Return a (cached) transformer from ``crs`` to EPSG:4326 in lon/lat order."""
+    return Transformer.from_crs(crs, "EPSG:4326", always_xy=True)
+
+
+def _to_lonlat(geometries: np.ndarray, crs: Any) -> np.ndarray:
+    """Reproject a geometry array from ``crs`` to EPSG:4326."""
+    transformer = _lonlat_transformer(crs)
+    return shapely.transform(
+        geometries, lambda xy: np.column_stack(transformer.transform(xy[:, 0], xy[:, 1]))
     )
 
-    return analysis
 
+def _nearest_points_lonlat(geometries: np.ndarray, points: np.ndarray, crs: Any) -> np.ndarray:
+    """Return the points of ``geometries`` closest to ``points`` (EPSG:4326 when ``crs`` is set)."""
+    nearest_points = shapely.get_point(shapely.shortest_line(geometries, points), 0)
+    if crs is None:
+        return nearest_points
+    return _to_lonlat(nearest_points, crs)
 
-def _find_nearest_receptor(
-    point: Point,
+
+def _receptor_distances(
     receptors: gpd.GeoDataFrame,
+    positions: np.ndarray,
+    distances: np.ndarray,
+    points: np.ndarray,
     receptor_type: str,
-    max_distance_km: float,
-    name_field: str = "NAME",
-    id_field: str = "ID",
-) -> ReceptorDistance | None:
-    """Find the nearest receptor to a point."""
-    # Ensure same CRS
-    if receptors.crs != "EPSG:4326":
-        receptors = receptors.to_crs("EPSG:4326")
-
-    # Calculate distances
-    distances = receptors.geometry.distance(point)
-    min_idx = distances.idxmin()
-    min_distance_m = distances.loc[min_idx]
-
-    if min_distance_m > max_distance_km * 1000:
-        return None
+    name_field: str,
+    id_field: str,
+) -> list[ReceptorDistance]:
+    """Build distance records for the receptors at rows ``positions`` (one point per record)."""
+    ids = receptors[id_field].to_numpy()[positions] if id_field in receptors.columns else None
+    names = receptors[name_field].to_numpy()[positions] if name_field in receptors.columns else None
+    geometries = np.asarray(receptors.geometry.values)[positions]
+    nearest_points = _nearest_points_lonlat(geometries, points, receptors.crs)
+    distances_m = distances.tolist()
+
+    return [
+        ReceptorDistance(
+            receptor_type=receptor_type,
+            receptor_id=str(ids[i]) if ids is not None else None,
+            receptor_name=str(names[i]) if names is not None else None,
+            distance_m=distances_m[i],
+            distance_km=distances_m[i] / 1000.0,
+            nearest_point=nearest_points[i],
+        )
+        for i in range(len(positions))
+    ]
 
-    receptor = receptors.loc[min_idx]
-    nearest_point = receptor.geometry.interpolate(
-        receptor.geometry.project(point)
-    )
 
-    return ReceptorDistance(
-        receptor_type=receptor_type,
-        receptor_id=str(receptor.get(id_field, "")) if id_field in receptor else None,
-        receptor_name=str(receptor.get(name_field, "")) if name_field in receptor else None,
-        distance_m=min_distance_m,
-        distance_km=min_distance_m / 1000.0,
-        nearest_point=nearest_point,
+def _receptor_index(
+    receptors: gpd.GeoDataFrame, n_queries: int
+) -> SpatialIndex | np.ndarray:
+    """
+    Index a receptor layer: its spatial index, or (n, 2) coordinates for a planar scan.
+
+    The spatial index is GeoPandas' ``sindex``, which is built once and cached on the
+    layer's geometry array. Reprojected and combined layers come from
+    ``_projected_layer``, so analyses that pass the same source layers again reuse
+    both the projected layer and its index.
+    """
+    if receptors.geometry.values.has_sindex or n_queries > PLANAR_SCAN_MAX_AOIS:
+        return receptors.sindex
+    geometries = np.asarray(receptors.geometry.values)
+    # Empty points have the point type id but no coordinates; leave them to the index
+    if bool(
+        np.all(shapely.get_type_id(geometries) == shapely.GeometryType.POINT)
+        and not shapely.is_empty(geometries).any()
+    ):
+        return np.column_stack([shapely.get_x(geometries), shapely.get_y(geometries)])
+    return receptors.sindex
+
+
+def _planar_scan(
+    points: np.ndarray, coords: np.ndarray, max_distance_m: float, nearest_only: bool
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Match point receptors to each query point by a brute-force planar distance scan."""
+    point_idx, receptor_idx, distances = [], [], []
+    for i, (x, y) in enumerate(zip(shapely.get_x(points), shapely.get_y(points), strict=True)):
+        dist = np.hypot(coords[:, 0] - x, coords[:, 1] - y)
+        if nearest_only:
+            hits = np.argmin(dist, keepdims=True) if len(dist) else np.empty(0, dtype=np.intp)
+            hits = hits[dist[hits] <= max_distance_m]
+        else:
+            hits = np.flatnonzero(dist <= max_distance_m)
+        point_idx.append(np.full(len(hits), i, dtype=np.intp))
+        receptor_idx.append(hits)
+        distances.append(dist[hits])
+    if not point_idx:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp), np.empty(0)
+    return np.concatenate(point_idx), np.concatenate(receptor_idx), np.concatenate(distances)
+
+
+def _nearest_receptors(
+    points: np.ndarray,
+    receptors: gpd.GeoDataFrame,
+    index: SpatialIndex | np.ndarray,
+    receptor_type: str,
+    max_distance_m: float,
+    name_field: str = "NAME",
+    id_field: str = "ID",
+) -> list[ReceptorDistance | None]:
+    """Find the nearest receptor within range of each point (all in the same metric CRS)."""
+    if isinstance(index, SpatialIndex):
+        (point_idx, receptor_idx), distances = index.nearest(
+            points, return_all=False, max_distance=max_distance_m, return_distance=True
+        )
+    else:
+        point_idx, receptor_idx, distances = _planar_scan(
+            points, index, max_distance_m, nearest_only=True
+        )
+    records = _receptor_distances(
+        receptors, receptor_idx, distances, points[point_idx], receptor_type, name_field, id_field
     )
+    nearest: list[ReceptorDistance | None] = [None] * len(points)
+    for i, record in zip(point_idx.tolist(), records, strict=True):
+        nearest[i] = record
+    return nearest
 
 
-def _find_all_receptors(
-    point: Point,
+def _find_receptors(
+    points: np.ndarray,
     receptors: gpd.GeoDataFrame,
+    index: SpatialIndex | np.ndarray,
     receptor_type: str,
-    max_distance_km: float,
+    max_distance_m: float,
     name_field: str = "NAME",
     id_field: str = "ID",
-) -> list[ReceptorDistance]:
-    """Find all receptors within max distance."""
-    if receptors.crs != "EPSG:4326":
-        receptors = receptors.to_crs("EPSG:4326")
+) -> tuple[list[ReceptorDistance | None], list[list[ReceptorDistance]]]:
+    """
+    Find the nearest and all receptors within max distance of each point in one pass.
 
-    max_distance_m = max_distance_km * 1000
-    distances = receptors.geometry.distance(point)
-    within_range = receptors[distances <= max_distance_m]
-
-    results = []
-    for idx, receptor in within_range.iterrows():
-        distance_m = distances.loc[idx]
-        nearest_point = receptor.geometry.interpolate(
-            receptor.geometry.project(point)
+    Points and receptors are in the same metric CRS. The nearest receptor is the
+    closest of those in range (the first in frame order on ties).
+    """
+    if isinstance(index, SpatialIndex):
+        # Sorted by point, keeping receptors in frame order
+        point_idx, receptor_idx = index.query(
+            points, predicate="dwithin", distance=max_distance_m, sort=True
         )
-
-        results.append(
-            ReceptorDistance(
-                receptor_type=receptor_type,
-                receptor_id=str(receptor.get(id_field, "")) if id_field in receptor else None,
-                receptor_name=str(receptor.get(name_field, "")) if name_field in receptor else None,
-                distance_m=distance_m,
-                distance_km=distance_m / 1000.0,
-                nearest_point=nearest_point,
-            )
+        distances = shapely.distance(points[point_idx], index.geometries[receptor_idx])
+    else:
+        point_idx, receptor_idx, distances = _planar_scan(
+            points, index, max_distance_m, nearest_only=False
         )
+    records = _receptor_distances(
+        receptors, receptor_idx, distances, points[point_idx], receptor_type, name_field, id_field
+    )
 
-    return results
-
+    nearest: list[ReceptorDistance | None] = [None] * len(points)
+    within: list[list[ReceptorDistance]] = [[] for _ in range(len(points))]
+    for i, record in zip(point_idx.tolist(), records, strict=True):
+        within[i].append(record)
+        if nearest[i] is None or record.distance_m < nearest[i].distance_m:
+            nearest[i] = record
+    return nearest, within
@@ -4,7 +4,23 @@ from __future__ import annotations
 
 import geopandas as gpd
 
+from ..utils.geometry import compute_area_ha
 from .kpis import EnvironmentalKPIs
+from .land_cover_classes import (
+    AGRI_CLASSES,
+    HETEROGENEOUS_AGRI_CLASSES,
+    IMPERVIOUS_CLASSES,
+    NATURAL_HABITAT_CLASSES,
+    category_areas,
+    summary_arrays,
+)
+
+# Land cover categories feeding the RESM features
+_RESM_CATEGORIES = {
+    "impervious": IMPERVIOUS_CLASSES,
+    "natural": NATURAL_HABITAT_CLASSES,
+    "agricultural": AGRI_CLASSES | HETEROGENEOUS_AGRI_CLASSES,
+}
 
 
 def build_resm_features(
@@ -27,33 +43,22 @@ def build_resm_features(
     Returns:
         Dictionary of feature values
     """
-    aoi_area_ha = aoi.geometry.area.sum() / 10_000
+    aoi_area_ha = compute_area_ha(aoi)
 
-    # Land use features
-    impervious_classes = {"111", "112", "121", "122", "131", "133"}
-    impervious_area = sum(
-        float(row.get("total_area_ha", 0))
-        for row in land_cover_summary
-        if str(row.get("class_code")) in impervious_classes
+    areas_by_category = category_areas(
+        *summary_arrays(land_cover_summary), _RESM_CATEGORIES
     )
+
+    # Land use features
+    impervious_area = areas_by_category["impervious"]
     impervious_ratio = impervious_area / aoi_area_ha if aoi_area_ha > 0 else 0.0
 
     # Natural habitat features
-    natural_classes = {"311", "312", "313", "321", "322", "324", "411", "412", "421"}
-    natural_area = sum(
-        float(row.get("total_area_ha", 0))
-        for row in land_cover_summary
-        if str(row.get("class_code")) in natural_classes
-    )
+    natural_area = areas_by_category["natural"]
     natural_ratio = natural_area / aoi_area_ha if aoi_area_ha > 0 else 0.0
 
     # Agricultural land (often suitable for renewables)
-    agri_classes = {"211", "212", "213", "221", "222", "223", "231", "241", "242", "243"}
-    agri_area = sum(
-        float(row.get("total_area_ha", 0))
-        for row in land_cover_summary
-        if str(row.get("class_code")) in agri_classes
-    )
+    agri_area = areas_by_category["agricultural"]
     agri_ratio = agri_area / aoi_area_ha if aoi_area_ha > 0 else 0.0
 
     # Distance to protected areas (constraint)
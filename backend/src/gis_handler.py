@@ -17,6 +17,29 @@ from .logging_utils import get_logger
 logger = get_logger(__name__)
 
 
+def _read_vector(dataset_path: Path, bbox: tuple[float, ...]) -> GeoDataFrame:
+    """
+    Read the features of a vector dataset that intersect ``bbox``.
+
+    GeoParquet files are read through Arrow with the bbox pushed into the read (row
+    groups outside it are skipped); everything else goes through pyogrio, which
+    decodes geometries in bulk into shapely 2 arrays.
+    """
+    if dataset_path.suffix.lower() == ".parquet":
+        try:
+            return gpd.read_parquet(dataset_path, bbox=bbox)
+        except ValueError:
+            # Files written without a bbox covering column cannot be filtered on read
+            logger.warning(
+                "%s has no bbox covering column; reading it in full. Rewrite it with "
+                "to_parquet(write_covering_bbox=True) to filter on read.",
+                dataset_path,
+            )
+            minx, miny, maxx, maxy = bbox
+            return gpd.read_parquet(dataset_path).cx[minx:maxx, miny:maxy]
+    return gpd.read_file(dataset_path, bbox=bbox, engine="pyogrio")
+
+
 class GISHandler:
     def __init__(self, output_dir: Path) -> None:
         self.output_dir = output_dir
@@ -88,16 +111,16 @@ class GISHandler:
                     # Generate a cache key that includes bbox
                     gdf = catalog.cache.get(
                         dataset_path,
-                        lambda p, **kw: gpd.read_file(p, bbox=bbox),
+                        lambda p, **kw: _read_vector(p, bbox),
                         bbox=bbox,
                     )
                 except Exception as exc:
                     logger.warning("Cache load failed, falling back to direct read: %s", exc)
-                    gdf = gpd.read_file(dataset_path, bbox=bbox)
+                    gdf = _read_vector(dataset_path, bbox)
             else:
-                gdf = gpd.read_file(dataset_path, bbox=bbox)
+                gdf = _read_vector(dataset_path, bbox)
         else:
-            gdf = gpd.read_file(dataset_path, bbox=bbox)
+            gdf = _read_vector(dataset_path, bbox)
         if gdf.empty:
             logger.warning("Dataset %s returned no features within AOI bbox.", dataset_path)
             return gdf
@@ -27,7 +27,7 @@ from .gis_handler import GISHandler
 from .logging_utils import configure_logging, get_logger
 from .utils.dataset_checker import DatasetAvailabilityChecker
 from .utils.error_handling import safe_dataset_load
-from .utils.geometry import buffer_aoi, load_aoi
+from .utils.geometry import buffer_aoi, compute_area_ha, load_aoi
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 if str(REPO_ROOT) not in sys.path:
@@ -515,7 +515,7 @@ def main() -> None:
                     "project_operation_tco2e_per_year": emission_result.as_dict().get("project_operation_tco2e_per_year", 0.0),
                     "ghg_emissions_intensity": environmental_kpis.ghg_emissions_intensity,
                     "forest_ratio": environmental_kpis.natural_habitat_ratio,  # Approximate
-                    "aoi_area_ha": aoi.geometry.area.sum() / 10_000,
+                    "aoi_area_ha": compute_area_ha(aoi),
                     "natural_habitat_ratio": environmental_kpis.natural_habitat_ratio,
                     "distance_to_water_km": (
                         receptor_summary.get("nearest_water_body", {}).get("distance_km", 999.0)
@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from functools import lru_cache
 from pathlib import Path
+from typing import Any
 
 import geopandas as gpd
+import numpy as np
+import shapely
+from pyproj import CRS, Transformer
 from shapely import wkt
 from shapely.geometry import (
     GeometryCollection,
@@ -21,6 +26,9 @@ from ..logging_utils import get_logger
 
 logger = get_logger(__name__)
 
+# Equal-area CRS used when an AOI arrives in geographic coordinates.
+EQUAL_AREA_CRS = "EPSG:6933"
+
 
 def _load_vector(path: Path) -> gpd.GeoDataFrame:
     """Load a vector file (GeoJSON, Shapefile, GeoPackage, etc.)."""
@@ -204,6 +212,38 @@ def load_aoi(aoi_input: str, target_crs: str) -> gpd.GeoDataFrame:
     return gdf
 
 
+def compute_area_ha(gdf: gpd.GeoDataFrame | gpd.GeoSeries) -> float:
+    """Return the total area in hectares, projecting geographic CRSs to equal-area first."""
+    if gdf.empty:
+        return 0.0
+    return geometries_area_ha(np.asarray(gdf.geometry.values), gdf.crs)
+
+
+@lru_cache(maxsize=8)
+def _equal_area_transformer(crs: CRS) -> Transformer:
+    """Return a (cached) transformer from ``crs`` to ``EQUAL_AREA_CRS``."""
+    return Transformer.from_crs(crs, EQUAL_AREA_CRS, always_xy=True)
+
+
+def geometries_area_ha(geometries: np.ndarray, crs: Any) -> float:
+    """
+    Return the total area in hectares of a shapely geometry array in ``crs``.
+
+    Same as ``compute_area_ha`` without a GeoPandas frame: geographic coordinates
+    are projected to ``EQUAL_AREA_CRS`` first, metric ones are measured as they are.
+    """
+    if len(geometries) == 0:
+        return 0.0
+    crs = CRS.from_user_input(crs) if crs is not None else None
+    if crs is not None and crs.is_geographic:
+        transformer = _equal_area_transformer(crs)
+        geometries = shapely.transform(
+            geometries,
+            lambda xy: np.column_stack(transformer.transform(xy[:, 0], xy[:, 1])),
+        )
+    return float(np.nansum(shapely.area(geometries))) / 10_000
+
+
 def buffer_aoi(aoi: gpd.GeoDataFrame, buffer_km: float) -> gpd.GeoDataFrame:
     if buffer_km <= 0:
         return aoi
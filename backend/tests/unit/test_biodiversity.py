@@ -0,0 +1,89 @@
+"""Unit tests for biodiversity feature engineering."""
+
+from __future__ import annotations
+
+import geopandas as gpd
+import pandas as pd
+import pytest
+from shapely.geometry import box
+
+from src.analysis.biodiversity import (
+    compute_overlap_metrics,
+    compute_overlap_metrics_scalar,
+    forest_ratio,
+)
+
+SUMMARY = [
+    {"class_code": "311", "total_area_ha": 30.0},
+    {"class_code": 312, "total_area_ha": 10.0},
+    {"class_code": "211", "total_area_ha": 60.0},
+]
+
+
+@pytest.mark.unit
+class TestForestRatio:
+    """Test forest ratio calculation."""
+
+    def test_forest_ratio_records(self) -> None:
+        """Test forest ratio from list-of-records summary."""
+        assert forest_ratio(SUMMARY) == pytest.approx(0.4)
+
+    def test_forest_ratio_dataframe_matches_records(self) -> None:
+        """Test the DataFrame fast path matches the records path."""
+        assert forest_ratio(pd.DataFrame(SUMMARY)) == pytest.approx(
+            forest_ratio(SUMMARY)
+        )
+
+    def test_forest_ratio_empty(self) -> None:
+        """Test empty summaries yield zero."""
+        assert forest_ratio([]) == 0.0
+        assert forest_ratio(pd.DataFrame(columns=["class_code", "total_area_ha"])) == 0.0
+
+
+@pytest.mark.unit
+@pytest.mark.geospatial
+class TestOverlapMetrics:
+    """Test protected-area overlap metrics."""
+
+    def test_overlap_metrics(self) -> None:
+        """Test overlap area, touching sites and multi-part AOIs."""
+        aoi = gpd.GeoDataFrame(
+            geometry=[box(0, 0, 1000, 1000), box(2000, 0, 3000, 1000)], crs="EPSG:3035"
+        )
+        protected = gpd.GeoDataFrame(
+            {"SITECODE": ["touch", "inside", "spanning", "far"]},
+            geometry=[
+                box(1000, 0, 1500, 500),
+                box(100, 100, 200, 200),
+                box(500, 500, 2500, 600),
+                box(9000, 9000, 9100, 9100),
+            ],
+            crs="EPSG:3035",
+        )
+        metrics, overlap = compute_overlap_metrics(aoi, protected)
+        assert metrics["protected_overlap_ha"] == pytest.approx(11.0)
+        assert metrics["protected_overlap_pct"] == pytest.approx(5.5)
+        assert metrics["protected_site_count"] == 2
+        assert sorted(overlap["SITECODE"]) == ["inside", "spanning"]
+        assert compute_overlap_metrics_scalar(aoi, protected) == metrics
+
+    def test_overlap_metrics_geographic_crs(self) -> None:
+        """Test geographic inputs are measured in an equal-area CRS on both paths."""
+        aoi = gpd.GeoDataFrame(geometry=[box(10.0, 50.0, 10.1, 50.1)], crs="EPSG:4326")
+        protected = gpd.GeoDataFrame(
+            {"SITECODE": ["half"]}, geometry=[box(10.0, 50.0, 10.05, 50.1)], crs="EPSG:4326"
+        )
+        metrics, overlap = compute_overlap_metrics(aoi, protected)
+        expected_ha = overlap.to_crs("EPSG:6933").area.sum() / 10_000
+        assert metrics["protected_overlap_ha"] == pytest.approx(expected_ha)
+        assert metrics["protected_overlap_pct"] == pytest.approx(50.0, rel=1e-3)
+        assert compute_overlap_metrics_scalar(aoi, protected) == metrics
+
+    def test_overlap_metrics_no_protected_areas(self) -> None:
+        """Test empty protected areas yield zero metrics."""
+        aoi = gpd.GeoDataFrame(geometry=[box(0, 0, 1000, 1000)], crs="EPSG:3035")
+        metrics, overlap = compute_overlap_metrics(
+            aoi, gpd.GeoDataFrame(geometry=[], crs="EPSG:3035")
+        )
+        assert metrics["protected_overlap_ha"] == 0.0
+        assert overlap.empty
@@ -4,9 +4,9 @@ from __future__ import annotations
 
 import pytest
 from hypothesis import given, strategies as st
-from shapely.geometry import Point, Polygon
+from shapely.geometry import Point, Polygon, box
 
-from src.utils.geometry import load_aoi
+from src.utils.geometry import buffer_aoi, compute_area_ha, load_aoi
 
 
 @pytest.mark.unit
@@ -49,3 +49,19 @@ class TestGeometryUtils:
         gdf = load_aoi(wkt, "EPSG:3035")  # ETRS89 / LAEA Europe
         assert gdf.crs.to_string() == "EPSG:3035"
 
+    def test_compute_area_ha_uses_equal_area(self) -> None:
+        """Test geographic AOIs are measured in an equal-area CRS."""
+        wkt = "POLYGON((10 50, 11 50, 11 51, 10 51, 10 50))"
+        gdf = load_aoi(wkt, "EPSG:4326")
+        expected = gdf.to_crs("EPSG:6933").geometry.area.sum() / 10_000
+        assert compute_area_ha(gdf) == pytest.approx(expected)
+
+    def test_area_follows_derived_frames(self) -> None:
+        """Test buffered and clipped AOIs report their own area."""
+        wkt = "POLYGON((10 50, 11 50, 11 51, 10 51, 10 50))"
+        gdf = load_aoi(wkt, "EPSG:3035")
+        area_ha = compute_area_ha(gdf)
+        assert compute_area_ha(buffer_aoi(gdf, 1.0)) > area_ha
+        minx, miny, _, _ = gdf.total_bounds
+        clipped = gdf.clip(box(minx, miny, minx + 1000, miny + 1000))
+        assert compute_area_ha(clipped) < area_ha
@@ -0,0 +1,197 @@
+"""Unit tests for environmental KPIs."""
+
+from __future__ import annotations
+
+import dataclasses
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pytest
+from shapely.geometry import box
+
+from src.analysis.kpis import (
+    KPI_FIELD_NAMES,
+    EnvironmentalKPIs,
+    calculate_comprehensive_kpis,
+    calculate_ecosystem_service_value,
+    calculate_edge_density,
+    calculate_habitat_fragmentation_index,
+    calculate_patch_density,
+    calculate_shannon_diversity_index,
+    calculate_soil_erosion_risk,
+    calculate_water_regulation_capacity,
+)
+
+SUMMARY = [
+    {"class_code": "311", "total_area_ha": 60.0},
+    {"class_code": 111, "total_area_ha": 30.0},
+    {"class_code": "999", "total_area_ha": 10.0},
+]
+
+
+@pytest.mark.unit
+class TestCoefficientKPIs:
+    """Test area-weighted coefficient KPIs."""
+
+    def test_ecosystem_service_value(self) -> None:
+        """Test weighting, integer codes and the default for unlisted classes."""
+        expected = 0.6 * 0.95 + 0.3 * 0.20 + 0.1 * 0.30
+        assert calculate_ecosystem_service_value(SUMMARY) == pytest.approx(expected)
+
+    def test_water_regulation_capacity(self) -> None:
+        """Test water regulation weighting."""
+        expected = 0.6 * 0.95 + 0.3 * 0.10 + 0.1 * 0.40
+        assert calculate_water_regulation_capacity(SUMMARY) == pytest.approx(expected)
+
+    def test_soil_erosion_risk(self) -> None:
+        """Test erosion risk weighting."""
+        expected = 0.6 * 0.15 + 0.3 * 0.40 + 0.1 * 0.50
+        assert calculate_soil_erosion_risk(SUMMARY) == pytest.approx(expected)
+
+    def test_dataframe_summary(self) -> None:
+        """Test a DataFrame summary with categorical codes matches the record list."""
+        frame = pd.DataFrame(SUMMARY)
+        frame["class_code"] = frame["class_code"].astype(str).astype("category")
+        for kpi in (
+            calculate_ecosystem_service_value,
+            calculate_water_regulation_capacity,
+            calculate_soil_erosion_risk,
+            calculate_shannon_diversity_index,
+        ):
+            assert kpi(frame) == pytest.approx(kpi(SUMMARY))
+        assert calculate_soil_erosion_risk(pd.DataFrame()) == 0.5
+
+    def test_empty_summary_defaults(self) -> None:
+        """Test empty summaries fall back to the documented defaults."""
+        assert calculate_ecosystem_service_value([]) == 0.0
+        assert calculate_water_regulation_capacity([]) == 0.0
+        assert calculate_soil_erosion_risk([]) == 0.5
+        assert calculate_soil_erosion_risk([{"class_code": "311", "total_area_ha": 0}]) == 0.5
+
+
+@pytest.mark.unit
+class TestShannonDiversity:
+    """Test the normalized Shannon diversity index."""
+
+    def test_even_cover_is_maximal(self) -> None:
+        """Test equal class areas give an index of 1."""
+        summary = [{"class_code": c, "total_area_ha": 25.0} for c in ("111", "211", "311", "411")]
+        assert calculate_shannon_diversity_index(summary) == pytest.approx(1.0)
+
+    def test_uneven_cover(self) -> None:
+        """Test the index against the closed form and ignores empty classes."""
+        p = np.array([0.6, 0.3, 0.1])
+        expected = -np.sum(p * np.log(p)) / np.log(3)
+        summary = [*SUMMARY, {"class_code": "512", "total_area_ha": 0.0}]
+        assert calculate_shannon_diversity_index(summary) == pytest.approx(expected)
+
+    def test_degenerate_summaries(self) -> None:
+        """Test empty, zero-area and single-class summaries return 0."""
+        assert calculate_shannon_diversity_index([]) == 0.0
+        assert calculate_shannon_diversity_index([{"total_area_ha": 0}]) == 0.0
+        assert calculate_shannon_diversity_index(SUMMARY[:1]) == 0.0
+
+
+@pytest.mark.unit
+@pytest.mark.geospatial
+class TestLandscapeMetrics:
+    """Test FRAGSTATS-style landscape metrics."""
+
+    # Three 1 ha squares in two classes
+    LAND_COVER = gpd.GeoDataFrame(
+        {"code_18": ["311", "311", "211"]},
+        geometry=[box(0, 0, 100, 100), box(100, 0, 200, 100), box(0, 100, 100, 200)],
+        crs="EPSG:3035",
+    )
+
+    def test_patch_density(self) -> None:
+        """Test patches are counted per class."""
+        assert calculate_patch_density(self.LAND_COVER, "code_18") == pytest.approx(200 / 3)
+
+    def test_connected_patch_density(self) -> None:
+        """Test connected components are counted per class when requested."""
+        land_cover = gpd.GeoDataFrame(
+            {"code_18": ["311", "311", "211"]},
+            geometry=[box(0, 0, 100, 100), box(200, 0, 300, 100), box(0, 100, 100, 200)],
+            crs="EPSG:3035",
+        )
+        assert calculate_patch_density(land_cover, "code_18") == pytest.approx(200 / 3)
+        assert calculate_patch_density(
+            land_cover, "code_18", connected_patches=True
+        ) == pytest.approx(100.0)
+        assert calculate_patch_density(
+            self.LAND_COVER, "code_18", connected_patches=True
+        ) == pytest.approx(200 / 3)
+
+    def test_habitat_fragmentation_index(self) -> None:
+        """Test fragmentation is patch density normalized by 50 and capped at 1."""
+        assert calculate_habitat_fragmentation_index(
+            self.LAND_COVER, "code_18"
+        ) == pytest.approx(1.0)
+
+    def test_edge_density(self) -> None:
+        """Test edge density is total perimeter per hectare."""
+        assert calculate_edge_density(self.LAND_COVER, "code_18") == pytest.approx(400.0)
+
+
+@pytest.mark.unit
+@pytest.mark.geospatial
+class TestComprehensiveKPIs:
+    """Test the combined KPI calculation."""
+
+    def test_category_ratios(self) -> None:
+        """Test forest, impervious and natural areas are classified per code."""
+        aoi = gpd.GeoDataFrame(geometry=[box(0, 0, 1000, 1000)], crs="EPSG:3035")
+        empty = gpd.GeoDataFrame(geometry=[], crs="EPSG:3035")
+        summary = [*SUMMARY, {"class_code": "411", "total_area_ha": 5.0}]
+        kpis = calculate_comprehensive_kpis(aoi, empty, summary, empty, {}, 10.0)
+        assert kpis.impervious_surface_ratio == pytest.approx(0.30)
+        assert kpis.natural_habitat_ratio == pytest.approx(0.65)
+        assert kpis.carbon_sequestration_potential == pytest.approx(60.0 * 5.0 / 100.0)
+
+    def test_labels_only_land_cover_uses_defaults(self) -> None:
+        """Test text label columns are not taken as class codes."""
+        aoi = gpd.GeoDataFrame(geometry=[box(0, 0, 1000, 1000)], crs="EPSG:3035")
+        land_cover = gpd.GeoDataFrame(
+            {"LABEL3": ["Broad-leaved forest", "Pastures"]},
+            geometry=[box(0, 0, 500, 1000), box(500, 0, 1000, 1000)],
+            crs="EPSG:3035",
+        )
+        protected = gpd.GeoDataFrame(geometry=[box(0, 0, 500, 1000)], crs="EPSG:3035")
+        kpis = calculate_comprehensive_kpis(aoi, land_cover, SUMMARY, protected, {}, 10.0)
+        assert kpis.habitat_fragmentation_index == pytest.approx(0.5)
+        assert kpis.patch_density == 0.0
+        assert kpis.edge_density == 0.0
+        # Only the protected share counts towards connectivity
+        assert kpis.connectivity_index == pytest.approx(0.5 * 0.6)
+
+
+@pytest.mark.unit
+class TestEnvironmentalKPIs:
+    """Test the KPI result container."""
+
+    KPIS = EnvironmentalKPIs(**{name: float(i) for i, name in enumerate(KPI_FIELD_NAMES)})
+
+    def test_as_dict(self) -> None:
+        """Test the nested sections and renamed output keys."""
+        result = self.KPIS.as_dict()
+        assert list(result) == [
+            "emissions_climate",
+            "land_use",
+            "biodiversity",
+            "ecosystem_services",
+            "air_quality",
+            "resource_efficiency",
+        ]
+        assert result["biodiversity"]["patch_density_per_100ha"] == self.KPIS.patch_density
+        assert sum(len(section) for section in result.values()) == len(KPI_FIELD_NAMES)
+
+    def test_as_flat_array(self) -> None:
+        """Test the flat vector follows field order."""
+        np.testing.assert_array_equal(self.KPIS.as_flat_array(), np.arange(len(KPI_FIELD_NAMES)))
+
+    def test_frozen(self) -> None:
+        """Test results cannot be mutated after construction."""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            self.KPIS.patch_density = 1.0  # type: ignore[misc]
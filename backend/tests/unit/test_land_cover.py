@@ -0,0 +1,98 @@
+"""Unit tests for land cover summaries."""
+
+from __future__ import annotations
+
+import geopandas as gpd
+import pandas as pd
+import pytest
+from shapely.geometry import box
+
+from src.analysis.land_cover import (
+    KPI_CLASS_FIELDS,
+    resolve_class_field,
+    summarize_land_cover,
+)
+from src.analysis.land_cover_classes import (
+    FOREST_CLASSES,
+    NATURAL_HABITAT_CLASSES,
+    category_areas,
+    summary_arrays,
+)
+
+SUMMARY = [
+    {"class_code": "311", "total_area_ha": 10.0},
+    {"class_code": 321, "total_area_ha": 5.0},
+    {"class_code": "111", "total_area_ha": 2.0},
+]
+
+
+@pytest.mark.unit
+@pytest.mark.geospatial
+class TestSummarizeLandCover:
+    """Test land cover summarization."""
+
+    def test_summarize_land_cover(self) -> None:
+        """Test per-class areas are summed and sorted by area."""
+        gdf = gpd.GeoDataFrame(
+            {"code_18": ["211", "311", "211", None]},
+            geometry=[
+                box(0, 0, 100, 100),
+                box(0, 0, 200, 100),
+                box(0, 0, 50, 100),
+                box(0, 0, 1000, 1000),
+            ],
+            crs="EPSG:3035",
+        )
+        summary = summarize_land_cover(gdf)
+        assert [row["class_code"] for row in summary] == ["311", "211"]
+        assert summary[0]["total_area_ha"] == pytest.approx(2.0)
+        assert summary[1]["total_area_ha"] == pytest.approx(1.5)
+
+    def test_summarize_land_cover_geographic_crs(self) -> None:
+        """Test geographic input is measured in an equal-area CRS."""
+        gdf = gpd.GeoDataFrame(
+            {"code_18": ["311"]}, geometry=[box(0, 0, 1000, 1000)], crs="EPSG:3035"
+        )
+        summary = summarize_land_cover(gdf.to_crs("EPSG:4326"))
+        assert summary[0]["total_area_ha"] == pytest.approx(100.0, rel=1e-3)
+
+    def test_summarize_land_cover_empty(self) -> None:
+        """Test empty input yields an empty summary."""
+        assert summarize_land_cover(gpd.GeoDataFrame(geometry=[], crs="EPSG:3035")) == []
+
+    def test_summarize_land_cover_missing_class_field(self) -> None:
+        """Test a missing CORINE class column raises."""
+        gdf = gpd.GeoDataFrame({"other": [1]}, geometry=[box(0, 0, 1, 1)], crs="EPSG:3035")
+        with pytest.raises(ValueError):
+            summarize_land_cover(gdf)
+
+    def test_resolve_class_field(self) -> None:
+        """Test the first matching candidate column is returned."""
+        gdf = gpd.GeoDataFrame(
+            {"CLC_CODE": ["311"], "class_code": ["311"]},
+            geometry=[box(0, 0, 1, 1)],
+            crs="EPSG:3035",
+        )
+        assert resolve_class_field(gdf) == "CLC_CODE"
+        assert resolve_class_field(gdf, KPI_CLASS_FIELDS) == "class_code"
+        assert resolve_class_field(gdf[["geometry"]]) is None
+
+
+@pytest.mark.unit
+class TestCategoryAreas:
+    """Test class-group area totals of land cover summaries."""
+
+    def test_overlapping_groups(self) -> None:
+        """Test a code counts towards every group containing it."""
+        totals = category_areas(
+            *summary_arrays(SUMMARY),
+            {"forest": FOREST_CLASSES, "natural": NATURAL_HABITAT_CLASSES},
+        )
+        assert totals == {"forest": 10.0, "natural": 15.0}
+
+    def test_dataframe_summary(self) -> None:
+        """Test DataFrame summaries give the same totals as record lists."""
+        categories = {"forest": FOREST_CLASSES}
+        from_records = category_areas(*summary_arrays(SUMMARY), categories)
+        from_frame = category_areas(*summary_arrays(pd.DataFrame(SUMMARY)), categories)
+        assert from_frame == from_records
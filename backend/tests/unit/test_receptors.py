@@ -0,0 +1,244 @@
+"""Unit tests for distance-to-receptor calculations."""
+
+from __future__ import annotations
+
+import gc
+
+import geopandas as gpd
+import pytest
+from shapely.geometry import LineString, MultiPolygon, Point, box
+
+from src.analysis import receptors as receptors_module
+from src.analysis.receptors import calculate_distance_to_receptors, calculate_distances_batch
+
+
+@pytest.mark.unit
+@pytest.mark.geospatial
+class TestDistanceToReceptors:
+    """Test receptor distances around a 1 km AOI in EPSG:3035."""
+
+    X0, Y0 = 4_300_000, 3_000_000
+    AOI = gpd.GeoDataFrame(geometry=[box(X0, Y0, X0 + 1000, Y0 + 1000)], crs="EPSG:3035")
+
+    def test_polygon_point_and_line_receptors(self) -> None:
+        """Test distances are metric for every receptor geometry type."""
+        x0, y0 = self.X0, self.Y0
+        protected = gpd.GeoDataFrame(
+            {"SITENAME": ["near", "far"], "SITECODE": ["s1", "s2"]},
+            geometry=[
+                box(x0 + 3500, y0, x0 + 4500, y0 + 1000),
+                box(x0 + 80_000, y0, x0 + 81_000, y0 + 1000),
+            ],
+            crs="EPSG:3035",
+        )
+        settlements = gpd.GeoDataFrame(
+            {"NAME": ["town"]}, geometry=[Point(x0 + 500, y0 + 10_500)], crs="EPSG:3035"
+        )
+        rivers = gpd.GeoDataFrame(
+            {"NAME": ["river"]},
+            geometry=[LineString([(x0 - 1500, y0 - 5000), (x0 - 1500, y0 + 5000)])],
+            crs="EPSG:3035",
+        )
+
+        analysis = calculate_distance_to_receptors(
+            self.AOI,
+            protected_areas=protected,
+            settlements=settlements,
+            water_bodies=rivers,
+            max_distance_km=50.0,
+        )
+
+        assert analysis.nearest_protected_area.receptor_id == "s1"
+        assert analysis.nearest_protected_area.distance_m == pytest.approx(3000, rel=1e-3)
+        assert analysis.nearest_settlement.distance_km == pytest.approx(10.0, rel=1e-3)
+        assert analysis.nearest_water_body.distance_m == pytest.approx(2000, rel=1e-3)
+        # The far site is outside 50 km and only the near site is listed again
+        protected_ids = [
+            r.receptor_id for r in analysis.all_receptors if r.receptor_type == "protected_area"
+        ]
+        assert protected_ids == ["s1", "s1"]
+        assert -180 <= analysis.aoi_centroid.x <= 180 and -90 <= analysis.aoi_centroid.y <= 90
+
+    def test_receptors_beyond_max_distance(self) -> None:
+        """Test receptors farther than the search radius are ignored."""
+        settlements = gpd.GeoDataFrame(
+            {"NAME": ["town"]},
+            geometry=[Point(self.X0 + 500, self.Y0 + 20_500)],
+            crs="EPSG:3035",
+        )
+        analysis = calculate_distance_to_receptors(
+            self.AOI, settlements=settlements, max_distance_km=10.0
+        )
+        assert analysis.nearest_settlement is None
+        assert analysis.all_receptors == []
+
+    def test_batch_matches_single_aoi_calls(self) -> None:
+        """Test batched AOIs get the same receptors as separate calls."""
+        x0, y0 = self.X0, self.Y0
+        aois = gpd.GeoDataFrame(
+            geometry=[
+                box(x0, y0, x0 + 1000, y0 + 1000),
+                box(x0 + 30_000, y0, x0 + 31_000, y0 + 1000),
+            ],
+            crs="EPSG:3035",
+        )
+        protected = gpd.GeoDataFrame(
+            {"SITENAME": ["west", "east"], "SITECODE": ["w", "e"]},
+            geometry=[
+                box(x0 + 3500, y0, x0 + 4500, y0 + 1000),
+                box(x0 + 33_500, y0, x0 + 34_500, y0 + 1000),
+            ],
+            crs="EPSG:3035",
+        )
+        settlements = gpd.GeoDataFrame(
+            {"NAME": ["town"]}, geometry=[Point(x0 + 500, y0 + 10_500)], crs="EPSG:3035"
+        )
+
+        batch = calculate_distances_batch(
+            aois, protected_areas=protected, settlements=settlements, max_distance_km=20.0
+        )
+
+        assert len(batch) == 2
+        assert [a.nearest_protected_area.receptor_id for a in batch] == ["w", "e"]
+        assert batch[1].nearest_settlement is None
+        for i, analysis in enumerate(batch):
+            single = calculate_distance_to_receptors(
+                aois.iloc[[i]], protected_areas=protected, settlements=settlements,
+                max_distance_km=20.0,
+            )
+            assert [(r.receptor_id, r.distance_m) for r in analysis.all_receptors] == [
+                (r.receptor_id, pytest.approx(r.distance_m)) for r in single.all_receptors
+            ]
+
+    def test_point_layer_scan_matches_spatial_index(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test the planar scan of point receptors agrees with the spatial index query."""
+        x0, y0 = self.X0, self.Y0
+        protected = gpd.GeoDataFrame(
+            {"SITENAME": ["a", "b", "c"], "SITECODE": ["a", "b", "c"]},
+            geometry=[
+                Point(x0 + 4500, y0 + 500),
+                Point(x0 - 7500, y0 + 500),
+                Point(x0 + 500, y0 + 60_500),
+            ],
+            crs="EPSG:3035",
+        )
+
+        def receptors() -> list[tuple[str | None, float]]:
+            analysis = calculate_distance_to_receptors(
+                self.AOI, protected_areas=protected, max_distance_km=50.0
+            )
+            return [(r.receptor_id, r.distance_m) for r in analysis.all_receptors]
+
+        scanned = receptors()
+        monkeypatch.setattr(receptors_module, "PLANAR_SCAN_MAX_AOIS", 0)
+        indexed = receptors()
+
+        assert [receptor_id for receptor_id, _ in scanned] == ["a", "a", "b"]
+        assert scanned == [(rid, pytest.approx(d)) for rid, d in indexed]
+
+    def test_multi_feature_aoi_matches_dissolved_aoi(self) -> None:
+        """Test a disjoint multi-feature AOI is measured from its joint centroid."""
+        x0, y0 = self.X0, self.Y0
+        parts = [box(x0, y0, x0 + 1000, y0 + 1000), box(x0 + 3000, y0, x0 + 5000, y0 + 1000)]
+        settlements = gpd.GeoDataFrame(
+            {"NAME": ["town"]}, geometry=[Point(x0 + 500, y0 + 10_500)], crs="EPSG:3035"
+        )
+
+        split = calculate_distance_to_receptors(
+            gpd.GeoDataFrame(geometry=parts, crs="EPSG:3035"), settlements=settlements
+        )
+        dissolved = calculate_distance_to_receptors(
+            gpd.GeoDataFrame(geometry=[MultiPolygon(parts)], crs="EPSG:3035"),
+            settlements=settlements,
+        )
+
+        assert split.nearest_settlement.distance_m == pytest.approx(
+            dissolved.nearest_settlement.distance_m
+        )
+        assert split.aoi_centroid.equals_exact(dissolved.aoi_centroid, 1e-9)
+
+    @pytest.mark.parametrize(
+        ("bounds", "crs"),
+        [
+            ((4_300_000, 3_000_000, 4_301_000, 3_001_000), "EPSG:3035"),
+            ((-43.3, -22.95, -43.1, -22.85), "EPSG:4326"),
+            ((179.5, 10.0, 179.9, 10.2), "EPSG:4326"),
+        ],
+    )
+    def test_metric_crs_matches_estimate_utm_crs(
+        self, bounds: tuple[float, float, float, float], crs: str
+    ) -> None:
+        """Test the memoized UTM zone matches GeoPandas' estimate."""
+        aoi = gpd.GeoDataFrame(geometry=[box(*bounds)], crs=crs)
+        assert receptors_module._metric_crs(aoi) == aoi.estimate_utm_crs()
+
+    def test_regional_and_global_protected_areas_are_combined(self) -> None:
+        """Test global protected areas in another CRS join the regional ones."""
+        x0, y0 = self.X0, self.Y0
+        regional = gpd.GeoDataFrame(
+            {"SITENAME": ["near"], "SITECODE": ["s1"], "AREA_HA": [100.0]},
+            geometry=[box(x0 + 3500, y0, x0 + 4500, y0 + 1000)],
+            crs="EPSG:3035",
+        )
+        global_sites = gpd.GeoDataFrame(
+            {"NAME": ["closer"], "WDPAID": [42]},
+            geometry=[box(x0 + 2500, y0, x0 + 3000, y0 + 1000)],
+            crs="EPSG:3035",
+        ).to_crs("EPSG:4326")
+
+        analysis = calculate_distance_to_receptors(
+            self.AOI, protected_areas=regional, protected_areas_global=global_sites
+        )
+
+        assert analysis.nearest_protected_area.distance_m == pytest.approx(2000, rel=1e-3)
+        distances = sorted(
+            r.distance_m for r in analysis.all_receptors if r.receptor_type == "protected_area"
+        )
+        assert distances == pytest.approx([2000, 2000, 3000], rel=1e-3)
+
+    def test_point_layer_with_empty_point(self) -> None:
+        """Test empty points in a point layer are skipped instead of failing the scan."""
+        settlements = gpd.GeoDataFrame(
+            {"NAME": ["empty", "town"]},
+            geometry=[Point(), Point(self.X0 + 500, self.Y0 + 10_500)],
+            crs="EPSG:3035",
+        )
+        analysis = calculate_distance_to_receptors(self.AOI, settlements=settlements)
+        assert analysis.nearest_settlement.receptor_name == "town"
+        assert analysis.nearest_settlement.distance_km == pytest.approx(10.0, rel=1e-3)
+
+    def test_projected_layers_reused_across_analyses(self) -> None:
+        """Test repeat analyses reuse the projected and combined receptor layers."""
+        x0, y0 = self.X0, self.Y0
+        regional = gpd.GeoDataFrame(
+            {"SITENAME": ["a"], "SITECODE": ["s1"]},
+            geometry=[box(x0 + 3500, y0, x0 + 4500, y0 + 1000)],
+            crs="EPSG:3035",
+        )
+        global_sites = gpd.GeoDataFrame(
+            {"NAME": ["b"], "WDPAID": [42]},
+            geometry=[box(x0 + 2500, y0, x0 + 3000, y0 + 1000)],
+            crs="EPSG:3035",
+        )
+        crs = receptors_module._metric_crs(self.AOI)
+
+        projected = receptors_module._cached_to_crs(regional, crs)
+        combined = receptors_module._combine_protected_areas(regional, global_sites, crs)
+        assert receptors_module._cached_to_crs(regional, crs) is projected
+        assert receptors_module._combine_protected_areas(regional, global_sites, crs) is combined
+        assert receptors_module._cached_to_crs(regional.copy(), crs) is not projected
+
+        first = calculate_distance_to_receptors(
+            self.AOI, protected_areas=regional, protected_areas_global=global_sites
+        )
+        assert combined.geometry.values.has_sindex
+        second = calculate_distance_to_receptors(
+            self.AOI, protected_areas=regional, protected_areas_global=global_sites
+        )
+        assert second.nearest_protected_area == first.nearest_protected_area
+
+        # Entries go away with their source layers
+        key = ((id(regional),), crs)
+        del regional, projected, combined, first, second
+        gc.collect()
+        assert key not in receptors_module._projected_layers
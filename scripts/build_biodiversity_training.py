@@ -25,7 +25,7 @@ import sys
 sys.path.append(str(BASE_DIR))
 from backend.src.analysis.land_cover import summarize_land_cover  # noqa: E402
 from backend.src.analysis.biodiversity import (  # noqa: E402
-    compute_overlap_metrics,
+    compute_overlap_metrics_scalar,
     build_biodiversity_features,
 )
 
@@ -95,7 +95,7 @@ def build_training_dataframe(sample_count: int, seed: int) -> pd.DataFrame:
             continue
 
         land_cover_summary = summarize_land_cover(corine_clip)
-        overlap_metrics, _ = compute_overlap_metrics(aoi, subset)
+        overlap_metrics = compute_overlap_metrics_scalar(aoi, subset)
         features = build_biodiversity_features(aoi, land_cover_summary, overlap_metrics)
         features["sitecode"] = row.SITECODE if hits and len(natura) > 0 else None
         features["sitename"] = row.SITENAME if hits and len(natura) > 0 else None